@@ -0,0 +1,90 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name, default):
+    """Прочитать целочисленную переменную окружения"""
+    return int(os.getenv(name, default))
+
+
+def _env_float(name, default):
+    """Прочитать дробную переменную окружения"""
+    return float(os.getenv(name, default))
+
+
+class Config:
+    """Настройки тестового запуска (из окружения и .env)"""
+
+    # Адрес приложения; значение LOCAL_BASE_URL поднимает локальную копию
+    LOCAL_BASE_URL = "local"
+    BASE_URL = os.getenv("BASE_URL", "https://construction-supervision.alex-fisher-dev.ru/")
+    LOCAL_APP_LATENCY = _env_float("LOCAL_APP_LATENCY", 0)
+
+    # Браузер по умолчанию и ограничения одновременно выполняемых тестов (не браузеров)
+    BROWSER = os.getenv("BROWSER", "chrome")
+    BROWSER_LIMITS = os.getenv("BROWSER_LIMITS", "")
+    BROWSER_SLOTS_DIR = os.getenv("BROWSER_SLOTS_DIR", ".cache/browser_slots")
+
+    # Ожидания: неявное ожидание не используется, только явные
+    EXPLICIT_WAIT = _env_float("EXPLICIT_WAIT", 10)
+    POLL_INTERVAL = _env_float("POLL_INTERVAL", 0.1)
+
+    # Профиль производительности браузера (см. utils/perf_profiles.py)
+    PERF_PROFILE = os.getenv("PERF_PROFILE", "default")
+    BLOCKED_URLS = [url for url in os.getenv("BLOCKED_URLS", "").split(",") if url]
+    STATIC_CACHE_DIR = os.getenv("STATIC_CACHE_DIR", ".cache/chrome-static")
+
+    # Пул браузеров
+    DRIVER_POOL_SIZE = _env_int("DRIVER_POOL_SIZE", 1)
+    DRIVER_MAX_USES = _env_int("DRIVER_MAX_USES", 50)
+    # Прогретый шаблон профиля Chrome и фоновый запуск следующего браузера
+    PROFILE_TEMPLATE = os.getenv("PROFILE_TEMPLATE", "1") == "1"
+    DRIVER_PRELAUNCH = os.getenv("DRIVER_PRELAUNCH", "0") == "1"
+
+    # Тестовый пользователь
+    TEST_EMAIL = os.getenv("TEST_EMAIL", "test@example.com")
+    TEST_PASSWORD = os.getenv("TEST_PASSWORD", "password")
+
+    # Снимок авторизованного состояния
+    AUTH_STATE_PATH = os.getenv("AUTH_STATE_PATH", ".auth/storage_state.json")
+    AUTH_STATE_TTL = _env_int("AUTH_STATE_TTL", 1800)
+
+    # Замеры времени команд и шагов
+    TIMINGS_DIR = os.getenv("TIMINGS_DIR", "reports/timings")
+    TIMINGS_TOP = _env_int("TIMINGS_TOP", 10)
+
+    # Артефакты упавших тестов: none / url / full
+    FAILURE_CAPTURE = os.getenv("FAILURE_CAPTURE", "full")
+    ARTIFACT_HTML_MAX_KB = _env_int("ARTIFACT_HTML_MAX_KB", 512)
+    ARTIFACT_SCREENSHOT_QUALITY = _env_int("ARTIFACT_SCREENSHOT_QUALITY", 60)
+    ARTIFACT_SCREENSHOT_SCALE = _env_float("ARTIFACT_SCREENSHOT_SCALE", 0.5)
+
+    # Длительности тестов для планирования xdist
+    DURATIONS_FILE = os.getenv("DURATIONS_FILE", ".cache/test_durations.json")
+    ALLURE_HISTORY_DIR = os.getenv("ALLURE_HISTORY_DIR", "")
+    DEFAULT_TEST_DURATION = _env_float("DEFAULT_TEST_DURATION", 5)
+
+    # Кэш суженных селекторов и отчет о поиске по локаторам
+    LOCATOR_CACHE = os.getenv("LOCATOR_CACHE", "1") == "1"
+    LOCATOR_CACHE_FILE = os.getenv("LOCATOR_CACHE_FILE", ".cache/locator_cache.json")
+    LOCATOR_REPORT_DIR = os.getenv("LOCATOR_REPORT_DIR", "reports/locators")
+
+    # Бенчмарк набора тестов (pytest --bench)
+    BENCH_RUNS = _env_int("BENCH_RUNS", 5)
+    BENCH_THRESHOLD = _env_float("BENCH_THRESHOLD", 0.2)
+    BENCH_MIN_DELTA = _env_float("BENCH_MIN_DELTA", 0.005)
+    BENCH_BASELINE_FILE = os.getenv("BENCH_BASELINE_FILE", "benchmarks/baseline.json")
+    BENCH_REPORT_DIR = os.getenv("BENCH_REPORT_DIR", "reports/bench")
+
+    # Карта влияния: какие методы страниц и локаторы использует каждый тест
+    IMPACT_MAP_FILE = os.getenv("IMPACT_MAP_FILE", ".cache/test_impact.json")
+    IMPACT_REPORT_DIR = os.getenv("IMPACT_REPORT_DIR", "reports/impact")
+
+    # Телеметрия ресурсов браузера и пороги роста за тест
+    RESOURCE_TELEMETRY = os.getenv("RESOURCE_TELEMETRY", "1") == "1"
+    RESOURCE_HEAP_GROWTH_MB = _env_float("RESOURCE_HEAP_GROWTH_MB", 10)
+    RESOURCE_NODES_GROWTH = _env_int("RESOURCE_NODES_GROWTH", 1000)
+    RESOURCE_REPORT_DIR = os.getenv("RESOURCE_REPORT_DIR", "reports/resources")
@@ -1,26 +1,293 @@
+import os
 import pytest
 import allure
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+from urllib.parse import urlsplit
+
+from config import Config
+from local_app.server import LocalApp
+from pages.login_page import LoginPage
+from utils.artifacts import FailureArtifactWriter
+from utils.auth_state import AuthStateCache
+from utils import perf_profiles, readiness, timings
+from utils.browser_slots import LOCKS_AVAILABLE, BrowserSlots, parse_limits
+from utils.driver_factory import FACTORIES, create_factory
+from utils.driver_pool import DriverPool, WarmPage
+
+pytest_plugins = [
+    "plugins.timings",
+    "plugins.scheduling",
+    "plugins.locators",
+    "plugins.bench",
+    "plugins.impact",
+    "plugins.resources",
+]
+
+driver_pool_stats_key = pytest.StashKey[list]()
+artifact_writer_key = pytest.StashKey[FailureArtifactWriter]()
+browsers_key = pytest.StashKey[list]()
+browser_limits_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-profile",
+        default=Config.PERF_PROFILE,
+        choices=sorted(perf_profiles.PROFILES),
+        help="Профиль производительности браузера (по умолчанию из PERF_PROFILE)",
+    )
+    parser.addoption(
+        "--browsers",
+        default=Config.BROWSER,
+        help="Браузеры через запятую, например chrome,firefox (по умолчанию из BROWSER)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "readonly: тест только читает страницу и может использовать общую загруженную страницу",
+    )
+    browsers = [name.strip() for name in config.getoption("browsers").split(",") if name.strip()]
+    unknown = [name for name in browsers if name not in FACTORIES]
+    if not browsers or unknown:
+        raise pytest.UsageError(
+            f"Неверный список браузеров: {config.getoption('browsers')!r}. "
+            f"Доступны: {', '.join(FACTORIES)}"
+        )
+    config.stash[browsers_key] = browsers
+    try:
+        limits = parse_limits(Config.BROWSER_LIMITS)
+    except ValueError as error:
+        raise pytest.UsageError(f"Неверный BROWSER_LIMITS={Config.BROWSER_LIMITS!r}: {error}")
+    if limits and not LOCKS_AVAILABLE:
+        raise pytest.UsageError("BROWSER_LIMITS поддерживается только на Linux и macOS")
+    config.stash[browser_limits_key] = limits
+    config.stash[driver_pool_stats_key] = []
+    config.stash[artifact_writer_key] = FailureArtifactWriter(
+        level=Config.FAILURE_CAPTURE,
+        html_max_bytes=Config.ARTIFACT_HTML_MAX_KB * 1024,
+        screenshot_quality=Config.ARTIFACT_SCREENSHOT_QUALITY,
+        screenshot_scale=Config.ARTIFACT_SCREENSHOT_SCALE,
+    )
+
+
+def pytest_generate_tests(metafunc):
+    # Несколько браузеров - каждый тест с браузером запускается в каждом из них
+    browsers = metafunc.config.stash[browsers_key]
+    if "browser" in metafunc.fixturenames and len(browsers) > 1:
+        metafunc.parametrize("browser", browsers, indirect=True, scope="session")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_url():
+    """Адрес тестируемого приложения.
+
+    При BASE_URL=local на время сессии воркера поднимается локальная
+    копия приложения, и Page Object переключаются на неё.
+    """
+    if Config.BASE_URL != Config.LOCAL_BASE_URL:
+        LoginPage.set_base_url(Config.BASE_URL)
+        yield LoginPage.URL
+        return
+
+    app = LocalApp(
+        Config.TEST_EMAIL, Config.TEST_PASSWORD, latency=Config.LOCAL_APP_LATENCY
+    ).start()
+    LoginPage.set_base_url(app.url)
+
+    yield app.url
+
+    app.stop()
+
+
+@pytest.fixture(scope="session")
+def perf_profile(request):
+    """Профиль производительности браузера для сессии"""
+    return perf_profiles.get_profile(
+        request.config.getoption("perf_profile"), Config.BLOCKED_URLS
+    )
+
+
+@pytest.fixture(scope="session")
+def browser(request):
+    """Имя браузера (chrome, firefox) для теста"""
+    return getattr(request, "param", request.config.stash[browsers_key][0])
+
+
+@pytest.fixture(scope="session")
+def browser_slots(request):
+    """Ограничение одновременно выполняемых тестов по браузерам на всех воркерах"""
+    return BrowserSlots(Config.BROWSER_SLOTS_DIR, request.config.stash[browser_limits_key])
+
+
+@pytest.fixture(scope="session")
+def driver_factory(browser, perf_profile, app_url):
+    """Фабрика браузеров воркера (для Chrome - общий chromedriver и прогретый профиль)"""
+    # Кэш статики у каждого воркера свой: Chrome не делит дисковый кэш между процессами
+    static_cache_dir = os.path.abspath(
+        os.path.join(Config.STATIC_CACHE_DIR, os.getenv("PYTEST_XDIST_WORKER", "main"))
+    )
+    factory = create_factory(
+        browser,
+        perf_profile,
+        warm_url=app_url,
+        use_template=Config.PROFILE_TEMPLATE,
+        prelaunch=Config.DRIVER_PRELAUNCH,
+        static_cache_dir=static_cache_dir,
+    )
+
+    yield factory
+
+    factory.close()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_factory):
+    """Пул браузеров на воркер (сессия pytest-xdist = один воркер)"""
+    pool = DriverPool(
+        driver_factory,
+        max_size=Config.DRIVER_POOL_SIZE,
+        max_uses=Config.DRIVER_MAX_USES,
+    )
+
+    yield pool
+
+    pool.close()
+    request.config.stash[driver_pool_stats_key].append(pool.stats())
 
 
 @pytest.fixture
-def driver():
-    """Фикстура для создания Chrome WebDriver"""
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--headless")  # Для CI/CD
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-gpu")
+def driver(browser, browser_slots, driver_pool, perf_profile, command_timings):
+    """Фикстура, выдающая WebDriver из пула"""
+    command_timings.meta["perf_profile"] = perf_profile["name"]
+    command_timings.meta["browser"] = browser
+    with browser_slots.acquire(browser):
+        driver = timings.instrument_driver(driver_pool.acquire())
 
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
+        yield driver
 
-    yield driver
+        driver_pool.release(driver)
 
-    driver.quit()
+
+@pytest.fixture(scope="session")
+def warm_login_page(driver_pool):
+    """Страница входа, загруженная один раз на воркер.
+
+    Браузер из пула удерживается всю сессию (с проверкой перед каждым
+    тестом); на его первой вкладке страница остается открытой для тестов
+    с маркером ``readonly``.
+    """
+    warm_page = WarmPage(driver_pool, lambda driver: LoginPage(driver).open())
+
+    yield warm_page
+
+    warm_page.close()
+
+
+@pytest.fixture
+def login_page(request, browser, browser_slots, warm_login_page, perf_profile, command_timings):
+    """Открытая страница входа.
+
+    Тест с маркером ``readonly`` получает общую прогретую страницу со
+    сброшенными формами. Остальные тесты получают новую вкладку того же
+    браузера (общий кэш и профиль), открытую на странице входа; после теста
+    вкладка закрывается, а cookies и localStorage очищаются.
+    """
+    command_timings.meta["perf_profile"] = perf_profile["name"]
+    command_timings.meta["browser"] = browser
+    with browser_slots.acquire(browser):
+        shared_page = warm_login_page.get()
+        if request.node.get_closest_marker("readonly"):
+            if not shared_page.is_on_login_page():
+                shared_page.open()
+            yield shared_page.reset_forms()
+            return
+
+        driver = shared_page.driver
+        home_handle = driver.current_window_handle
+        driver.switch_to.new_window("tab")
+        # Настройки CDP действуют на вкладку: повторяем их для новой
+        perf_profiles.apply_to_driver(driver, perf_profile)
+        readiness.install(driver)
+        login_page = LoginPage(driver).open()
+
+        yield login_page
+
+        try:
+            driver.close()
+            driver.switch_to.window(home_handle)
+            driver.execute_script("try { window.localStorage.clear(); } catch (e) {}")
+            driver.delete_all_cookies()
+        except WebDriverException:
+            # Упавший браузер заменит следующий warm_login_page.get()
+            pass
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache():
+    """Кэш авторизованного состояния (общий файл для всех воркеров)"""
+    return AuthStateCache(Config.AUTH_STATE_PATH, Config.AUTH_STATE_TTL)
+
+
+@pytest.fixture
+def logged_in_driver(driver, auth_state_cache):
+    """Браузер с авторизованным пользователем на странице проектов.
+
+    Вход через форму выполняется только если снимка нет, он истёк
+    или оказался невалидным (сервер вернул на страницу входа).
+    """
+    login_page = LoginPage(driver)
+    url = urlsplit(LoginPage.URL)
+    origin = f"{url.scheme}://{url.netloc}"
+    state = auth_state_cache.get(origin)
+    if state is not None and auth_state_cache.inject(driver, state):
+        if login_page.open_projects().is_on_projects_page():
+            return driver
+        auth_state_cache.invalidate(origin)
+        driver.delete_all_cookies()
+
+    with allure.step("Войти через форму и сохранить снимок сессии"):
+        login_page.open().login_and_wait(Config.TEST_EMAIL, Config.TEST_PASSWORD)
+        auth_state_cache.capture(driver)
+    return driver
+
+
+def pytest_sessionfinish(session):
+    session.config.stash[artifact_writer_key].close()
+
+    # На воркере xdist передаем статистику пула контроллеру
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["driver_pool"] = session.config.stash[driver_pool_stats_key]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Собрать статистику пулов с воркеров xdist"""
+    stats = getattr(node, "workeroutput", {}).get("driver_pool", [])
+    node.config.stash[driver_pool_stats_key].extend(stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Вывести статистику переиспользования браузеров"""
+    stats = config.stash[driver_pool_stats_key]
+    if not stats:
+        return
+    started = sum(item["started"] for item in stats)
+    reused = sum(item["reused"] for item in stats)
+    recycled = sum(item["recycled"] for item in stats)
+    startup_total = sum(item["startup_total"] for item in stats)
+    saved_time = sum(item["saved_time"] for item in stats)
+    terminalreporter.write_sep("-", "Пул браузеров")
+    terminalreporter.write_line(
+        f"Запусков браузера: {started}, переиспользований: {reused}, "
+        f"пересозданий: {recycled}"
+    )
+    terminalreporter.write_line(
+        f"Время на запуск: {startup_total:.1f} с, сэкономлено: {saved_time:.1f} с"
+    )
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -31,24 +298,13 @@ def pytest_runtest_makereport(item, call):
 
     if rep.when == "call" and rep.failed:
         driver = item.funcargs.get("driver")
-        if driver:
-            # Прикрепляем скриншот
-            allure.attach(
-                driver.get_screenshot_as_png(),
-                name=f"Скриншот_при_ошибке_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                attachment_type=allure.attachment_type.PNG,
-            )
-
-            # Прикрепляем текущий URL
-            allure.attach(
-                driver.current_url,
-                name="URL при ошибке",
-                attachment_type=allure.attachment_type.TEXT,
-            )
-
-            # Прикрепляем HTML страницы
-            allure.attach(
-                driver.page_source,
-                name="HTML страницы",
-                attachment_type=allure.attachment_type.HTML,
+        if driver is None and "login_page" in item.funcargs:
+            driver = item.funcargs["login_page"].driver
+        listener = item.config.pluginmanager.get_plugin("allure_listener")
+        if driver and listener:
+            # С браузера снимаем синхронно, сжатие и запись идут в фоне
+            item.config.stash[artifact_writer_key].capture(
+                driver,
+                listener.allure_logger,
+                name_suffix=f"_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             )
@@ -0,0 +1,135 @@
+import html
+import json
+import secrets
+import threading
+import time
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+SESSION_COOKIE = "session"
+
+
+class _AppHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов локальной копии приложения"""
+
+    server_version = "ConstructionSupervisionStub/1.0"
+
+    def log_message(self, format, *args):
+        # Не засоряем вывод pytest логами каждого запроса
+        pass
+
+    @property
+    def app(self):
+        return self.server.app
+
+    def _session_email(self):
+        """Email пользователя по cookie сессии или None"""
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = jar.get(SESSION_COOKIE)
+        return self.app.sessions.get(morsel.value) if morsel else None
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self, location, headers=None):
+        self._send(302, headers={"Location": location, **(headers or {})})
+
+    def do_GET(self):
+        self.app.delay()
+        path = self.path.split("?", 1)[0].rstrip("/") or "/"
+        if path == "/":
+            self._send(200, self.app.render("login.html"))
+        elif path == "/lk/projects":
+            email = self._session_email()
+            if email is None:
+                self._redirect("/")
+            else:
+                self._send(200, self.app.render("projects.html", email=email))
+        elif path == "/logout":
+            self._redirect("/", {"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+        else:
+            self._send(404, b"Not Found", "text/plain; charset=utf-8")
+
+    def do_POST(self):
+        self.app.delay()
+        if self.path != "/api/login":
+            self._send(404, b"Not Found", "text/plain; charset=utf-8")
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            payload = {}
+        email, password = payload.get("email"), payload.get("password")
+        if (email, password) != (self.app.email, self.app.password):
+            self._send(401, b'{"error": "invalid credentials"}', "application/json")
+            return
+        token = secrets.token_hex(16)
+        self.app.sessions[token] = email
+        self._send(
+            200,
+            b'{"ok": true}',
+            "application/json",
+            {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"},
+        )
+
+
+class LocalApp:
+    """Локальная копия construction-supervision для герметичных прогонов.
+
+    Отдаёт страницу входа, сообщения об ошибке, спиннер и ``/lk/projects``
+    с теми же селекторами, что в ``locators.py``. ``latency`` - искусственная
+    задержка каждого ответа в секундах.
+    """
+
+    def __init__(self, email, password, host="127.0.0.1", port=0, latency=0.0):
+        self.email = email
+        self.password = password
+        self.latency = latency
+        self.sessions = {}
+        self._templates = {}
+        self._server = ThreadingHTTPServer((host, port), _AppHandler)
+        self._server.daemon_threads = True
+        self._server.app = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """Базовый URL запущенного приложения (со слешем на конце)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def delay(self):
+        """Искусственная задержка ответа"""
+        if self.latency:
+            time.sleep(self.latency)
+
+    def render(self, name, **context):
+        """Отрисовать HTML-шаблон, подставив экранированные значения"""
+        if name not in self._templates:
+            self._templates[name] = (TEMPLATES_DIR / name).read_text(encoding="utf-8")
+        page = self._templates[name]
+        for key, value in context.items():
+            page = page.replace("{" + key + "}", html.escape(value))
+        return page.encode("utf-8")
+
+    def start(self):
+        """Запустить сервер в фоновом потоке"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Остановить сервер"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
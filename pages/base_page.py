@@ -1,35 +1,112 @@
+import time
 import allure
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from config import Config
 from locators import BasePageLocators
+from pages import scripts
+from utils import dom_snapshot, impact, locator_cache, readiness, timings
+
+# Стратегии поиска, которые можно выразить CSS-селектором
+_CSS_EQUIVALENTS = {
+    By.CSS_SELECTOR: "{}",
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
 
 
 class BasePage:
-    """Базовый класс для всех Page Object"""
+    """Базовый класс для всех Page Object.
+
+    Неявное ожидание драйвера не используется: проверки «есть ли элемент
+    сейчас» возвращаются сразу, а ожидания задаются явно через
+    ``wait_for()`` с тайм-аутом и интервалом опроса из ``Config``.
+
+    Публичные методы Page Object и ожидания замеряются ``utils.timings``.
+    Все поиски идут через ``find_elements()``, который при включённом
+    ``utils.locator_cache`` сначала пробует суженный селектор; то же делает
+    пакетный ``probe_elements()``. Для проверок структуры без обращений к
+    браузеру есть ``snapshot()``. Вызванные методы и использованные локаторы
+    отмечаются для ``utils.impact``.
+    """
 
-    def __init__(self, driver):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        timings.instrument_class(cls)
+        impact.instrument_class(cls)
+
+    def __init__(self, driver, timeout=None, poll_interval=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.timeout = Config.EXPLICIT_WAIT if timeout is None else timeout
+        self.poll_interval = (
+            Config.POLL_INTERVAL if poll_interval is None else poll_interval
+        )
+        self.wait = self.wait_for()
+
+    def wait_for(self, timeout=None):
+        """Создать явное ожидание по политике страницы"""
+        return timings.TimedWebDriverWait(
+            self.driver,
+            self.timeout if timeout is None else timeout,
+            poll_frequency=self.poll_interval,
+            ignored_exceptions=[StaleElementReferenceException],
+        )
+
+    def _present(self, locator):
+        """Условие ожидания: первый найденный элемент"""
+
+        def condition(driver):
+            elements = self.find_elements(locator)
+            return elements[0] if elements else False
+
+        return condition
+
+    def _visible(self, locator):
+        """Условие ожидания: первый найденный элемент, если он видим"""
+
+        def condition(driver):
+            element = self._present(locator)(driver)
+            return element if element and element.is_displayed() else False
+
+        return condition
+
+    def _clickable(self, locator):
+        """Условие ожидания: первый найденный элемент, если он видим и доступен"""
+
+        def condition(driver):
+            element = self._visible(locator)(driver)
+            return element if element and element.is_enabled() else False
+
+        return condition
 
     @allure.step("Открыть страницу: {url}")
     def open(self, url):
         """Открыть указанную страницу"""
         self.driver.get(url)
+        recorder = timings.current()
+        if recorder is not None:
+            recorder.page_loads.append(self.driver.execute_script(scripts.NAVIGATION_TIMING))
         return self
 
     @allure.step("Найти элемент: {locator}")
     def find_element(self, locator):
         """Найти элемент с ожиданием"""
-        return self.wait.until(EC.presence_of_element_located(locator))
+        return self.wait.until(self._present(locator))
 
     def find_elements(self, locator):
         """Найти все элементы по локатору"""
-        return self.driver.find_elements(*locator)
+        impact.touch_locator(locator)
+        cache = locator_cache.current()
+        if cache is None or locator[0] != By.CSS_SELECTOR:
+            return self.driver.find_elements(*locator)
+        return cache.find_elements(self.driver, type(self).__name__, locator)
 
     @allure.step("Кликнуть по элементу")
     def click_element(self, locator):
         """Кликнуть по элементу с ожиданием кликабельности"""
-        element = self.wait.until(EC.element_to_be_clickable(locator))
+        element = self.wait.until(self._clickable(locator))
         element.click()
         return self
 
@@ -47,31 +124,176 @@ class BasePage:
         return element.text
 
     def is_element_present(self, locator):
-        """Проверить наличие элемента на странице"""
+        """Проверить наличие элемента на странице прямо сейчас (без ожидания)"""
         elements = self.find_elements(locator)
         return len(elements) > 0
 
+    def is_element_present_within(self, locator, timeout=None):
+        """Проверить, что элемент появится в течение тайм-аута"""
+        try:
+            self.wait_for(timeout).until(self._present(locator))
+            return True
+        except TimeoutException:
+            return False
+
+    def is_element_absent_within(self, locator, timeout=None):
+        """Проверить, что элемент исчезнет в течение тайм-аута"""
+        try:
+            self.wait_for(timeout).until_not(self._present(locator))
+            return True
+        except TimeoutException:
+            return False
+
     def is_element_visible(self, locator):
         """Проверить видимость элемента"""
         element = self.find_element(locator)
         return element.is_displayed()
 
+    def probe_elements(self, locators):
+        """Проверить набор элементов за один запрос к браузеру.
+
+        Принимает список локаторов или словарь ``{имя: локатор}``. Возвращает
+        словарь с теми же ключами (для списка - сами локаторы), где для
+        каждого элемента указаны ``present``, ``count``, ``visible``,
+        ``enabled`` и ``text``. CSS-локаторы ищутся с учётом суженных
+        селекторов ``utils.locator_cache``.
+        """
+        if isinstance(locators, dict):
+            items = list(locators.items())
+        else:
+            items = [(locator, locator) for locator in locators]
+
+        cache = locator_cache.current()
+        page = type(self).__name__
+        probes = []
+        for index, (_, (by, value)) in enumerate(items):
+            impact.touch_locator((by, value))
+            if by == By.XPATH:
+                probes.append([str(index), "xpath", value, None, []])
+            elif by == By.CSS_SELECTOR and cache is not None:
+                alternatives = locator_cache.split_selector(value)
+                probes.append(
+                    [str(index), "css", value, cache.narrowed(page, value), alternatives]
+                )
+            elif by in _CSS_EQUIVALENTS:
+                probes.append([str(index), "css", _CSS_EQUIVALENTS[by].format(value), None, []])
+            else:
+                raise ValueError(f"Стратегия поиска не поддерживается: {by}")
+
+        started_at = time.perf_counter()
+        raw = self.driver.execute_script(scripts.PROBE_ELEMENTS, probes)
+        if cache is not None:
+            duration = (time.perf_counter() - started_at) / max(1, len(items))
+            for (_, locator), probe in zip(items, probes):
+                if not probe[4]:
+                    continue
+                result = raw[probe[0]]
+                matched = probe[4][result["matched"]] if result["matched"] >= 0 else None
+                outcome = "narrowed" if result["narrowed"] else "full" if matched else "misses"
+                cache.record(page, locator, matched, outcome, duration=duration)
+        return {key: raw[str(index)] for index, (key, _) in enumerate(items)}
+
+    def probe_elements_within(self, locators, state="present", timeout=None):
+        """Опрашивать набор элементов, пока у всех не выполнится state.
+
+        Возвращает последний результат ``probe_elements()`` - и при успехе,
+        и по истечении тайм-аута.
+        """
+        result = {}
+
+        def all_ready(driver):
+            result.update(self.probe_elements(locators))
+            return all(probe[state] for probe in result.values())
+
+        try:
+            self.wait_for(timeout).until(all_ready)
+        except TimeoutException:
+            pass
+        return result
+
+    def snapshot(self):
+        """Снять снимок DOM за один запрос к браузеру.
+
+        Снимок содержит разметку страницы с видимостью, доступностью,
+        значениями полей и габаритами каждого элемента. Дальнейшие проверки
+        структуры по ``utils.dom_snapshot.DomSnapshot`` идут без браузера.
+        """
+        return dom_snapshot.DomSnapshot(
+            self.driver.execute_script(scripts.DOM_SNAPSHOT), self._css
+        )
+
+    def snapshot_within(self, locators, state="present", timeout=None):
+        """Дождаться state у всех локаторов и снять один снимок DOM.
+
+        Ожидание идёт через лёгкий ``probe_elements_within()``, снимок
+        снимается один раз - и при успехе, и по истечении тайм-аута.
+        """
+        self.probe_elements_within(locators, state, timeout)
+        return self.snapshot()
+
     @allure.step("Ждать появления элемента")
-    def wait_for_element_visible(self, locator, timeout=10):
+    def wait_for_element_visible(self, locator, timeout=None):
         """Ждать появления видимого элемента"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self.wait_for(timeout).until(self._visible(locator))
 
-    def wait_for_element_clickable(self, locator, timeout=10):
+    def wait_for_element_clickable(self, locator, timeout=None):
         """Ждать, пока элемент станет кликабельным"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        return self.wait_for(timeout).until(self._clickable(locator))
+
+    def _css(self, locator):
+        """CSS-селектор локатора (для проверок внутри браузера)"""
+        impact.touch_locator(locator)
+        by, value = locator
+        if by not in _CSS_EQUIVALENTS:
+            raise ValueError(f"Стратегия поиска не поддерживается: {by}")
+        return _CSS_EQUIVALENTS[by].format(value)
+
+    def wait_until_ready(self, url_pattern=None, url_not=None, absent=None, present=None,
+                         network_idle=None, dom_stable=None, timeout=None):
+        """Ждать готовности страницы событиями внутри браузера.
+
+        Условия (все должны выполниться одновременно): ``url_pattern`` -
+        регулярное выражение для URL, ``url_not`` - URL отличается от
+        указанного, ``absent``/``present`` - локатор отсутствует/есть,
+        ``network_idle``/``dom_stable`` - секунды без запросов fetch/XHR и
+        без мутаций DOM. Ожидание - один ``execute_async_script``, который
+        завершается сразу после выполнения условий.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        owner = timings.current().current_method if timings.current() else None
+        timings.measure(
+            "wait",
+            owner or "wait_until_ready",
+            readiness.wait_until,
+            self.driver,
+            timeout,
+            url_pattern=url_pattern,
+            url_not=url_not,
+            absent_selector=None if absent is None else self._css(absent),
+            present_selector=None if present is None else self._css(present),
+            network_idle=network_idle,
+            dom_stable=dom_stable,
+        )
+        return self
 
     @allure.step("Ждать изменения URL")
-    def wait_for_url_change(self, current_url, timeout=10):
+    def wait_for_url_change(self, current_url, timeout=None):
         """Ждать изменения URL"""
-        wait = WebDriverWait(self.driver, timeout)
-        wait.until(lambda driver: driver.current_url != current_url)
+        return self.wait_until_ready(url_not=current_url, timeout=timeout)
+
+    @allure.step("Ждать завершения сетевых запросов")
+    def wait_for_network_idle(self, quiet=0.5, timeout=None):
+        """Ждать, пока fetch/XHR не будет в течение quiet секунд"""
+        return self.wait_until_ready(network_idle=quiet, timeout=timeout)
+
+    @allure.step("Ждать стабилизации DOM")
+    def wait_for_dom_stable(self, quiet=0.3, timeout=None):
+        """Ждать, пока DOM не меняется в течение quiet секунд"""
+        return self.wait_until_ready(dom_stable=quiet, timeout=timeout)
+
+    def reset_forms(self):
+        """Вернуть все формы страницы в исходное состояние"""
+        self.driver.execute_script(scripts.RESET_FORMS)
         return self
 
     def get_current_url(self):
@@ -88,11 +310,9 @@ class BasePage:
         return self.is_element_present(BasePageLocators.LOADING_SPINNER)
 
     @allure.step("Ждать завершения загрузки")
-    def wait_for_loading_complete(self, timeout=10):
+    def wait_for_loading_complete(self, timeout=None):
         """Ждать завершения загрузки (исчезновения спиннера)"""
-        wait = WebDriverWait(self.driver, timeout)
-        wait.until_not(EC.presence_of_element_located(BasePageLocators.LOADING_SPINNER))
-        return self
+        return self.wait_until_ready(absent=BasePageLocators.LOADING_SPINNER, timeout=timeout)
 
     def has_success_alert(self):
         """Проверить наличие сообщения об успехе"""
@@ -108,3 +328,7 @@ class BasePage:
         if self.is_element_present(BasePageLocators.MODAL_DIALOG):
             self.click_element(BasePageLocators.CLOSE_BUTTON)
         return self
+
+
+timings.instrument_class(BasePage)
+impact.instrument_class(BasePage)
@@ -1,4 +1,6 @@
 import allure
+from urllib.parse import urljoin
+from config import Config
 from pages.base_page import BasePage
 from locators import LoginPageLocators
 
@@ -6,8 +8,21 @@ from locators import LoginPageLocators
 class LoginPage(BasePage):
     """Page Object для страницы входа"""
 
-    URL = "https://construction-supervision.alex-fisher-dev.ru/"
-    PROJECTS_URL = "https://construction-supervision.alex-fisher-dev.ru/lk/projects"
+    URL = Config.BASE_URL
+    PROJECTS_URL = urljoin(Config.BASE_URL, "lk/projects")
+
+    # Основные элементы формы входа для пакетных проверок
+    FORM_ELEMENTS = {
+        "email": LoginPageLocators.EMAIL_INPUT,
+        "password": LoginPageLocators.PASSWORD_INPUT,
+        "login_button": LoginPageLocators.LOGIN_BUTTON,
+    }
+
+    @classmethod
+    def set_base_url(cls, base_url):
+        """Переключить Page Object на другой адрес приложения"""
+        cls.URL = base_url if base_url.endswith("/") else base_url + "/"
+        cls.PROJECTS_URL = urljoin(cls.URL, "lk/projects")
 
     @allure.step("Открыть страницу входа")
     def open(self):
@@ -15,6 +30,12 @@ class LoginPage(BasePage):
         super().open(self.URL)
         return self
 
+    @allure.step("Открыть страницу проектов")
+    def open_projects(self):
+        """Открыть страницу проектов напрямую (для авторизованной сессии)"""
+        super().open(self.PROJECTS_URL)
+        return self
+
     @allure.step("Ввести email: {email}")
     def enter_email(self, email):
         """Ввести email"""
@@ -35,7 +56,7 @@ class LoginPage(BasePage):
 
     @allure.step("Проверить наличие сообщения об ошибке")
     def has_error_message(self):
-        """Проверить наличие сообщения об ошибке"""
+        """Проверить наличие сообщения об ошибке (без ожидания)"""
         return self.is_element_present(LoginPageLocators.ERROR_MESSAGE)
 
     def get_error_message_text(self):
@@ -63,44 +84,48 @@ class LoginPage(BasePage):
         return self.is_on_projects_page()
 
     @allure.step("Ждать редиректа со страницы входа")
-    def wait_for_redirect(self, timeout=10):
+    def wait_for_redirect(self, timeout=None):
         """Ждать редиректа со страницы входа"""
         self.wait_for_url_change(self.URL, timeout)
         return self
 
     @allure.step("Ждать успешного входа в систему")
-    def wait_for_successful_login(self, timeout=10):
+    def wait_for_successful_login(self, timeout=None):
         """Ждать успешного входа (перехода на страницу проектов)"""
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
-
-        wait = WebDriverWait(self.driver, timeout)
-        wait.until(lambda driver: "/lk/projects" in driver.current_url)
-        return self
+        return self.wait_until_ready(url_pattern="/lk/projects", timeout=timeout)
 
     @allure.step("Проверить наличие поля email")
     def is_email_field_present(self):
         """Проверить наличие поля email"""
-        return self.is_element_present(LoginPageLocators.EMAIL_INPUT)
+        return self._is_form_element_present(LoginPageLocators.EMAIL_INPUT)
 
     @allure.step("Проверить наличие поля пароля")
     def is_password_field_present(self):
         """Проверить наличие поля пароля"""
-        return self.is_element_present(LoginPageLocators.PASSWORD_INPUT)
+        return self._is_form_element_present(LoginPageLocators.PASSWORD_INPUT)
 
     @allure.step("Проверить наличие кнопки входа")
     def is_login_button_present(self):
         """Проверить наличие кнопки входа"""
-        return self.is_element_present(LoginPageLocators.LOGIN_BUTTON)
+        return self._is_form_element_present(LoginPageLocators.LOGIN_BUTTON)
+
+    def _is_form_element_present(self, locator):
+        """Проверить, что элемент формы появится в течение тайм-аута"""
+        return self.probe_elements_within([locator])[locator]["present"]
 
     @allure.step("Проверить видимость всех элементов страницы")
     def are_all_elements_visible(self):
         """Проверить видимость всех основных элементов"""
-        return (
-            self.is_element_visible(LoginPageLocators.EMAIL_INPUT)
-            and self.is_element_visible(LoginPageLocators.PASSWORD_INPUT)
-            and self.is_element_visible(LoginPageLocators.LOGIN_BUTTON)
-        )
+        snapshot = self.snapshot_within(self.FORM_ELEMENTS.values(), "visible")
+        return all(snapshot.is_visible(locator) for locator in self.FORM_ELEMENTS.values())
+
+    @allure.step("Проверить наличие всех элементов формы входа")
+    def get_missing_form_elements(self):
+        """Получить имена отсутствующих элементов формы (пустой список - все на месте)"""
+        snapshot = self.snapshot_within(self.FORM_ELEMENTS.values(), "present")
+        return [
+            name for name, locator in self.FORM_ELEMENTS.items() if not snapshot.is_present(locator)
+        ]
 
     @allure.step("Выполнить вход с учетными данными: {email}")
     def login(self, email, password):
@@ -109,7 +134,7 @@ class LoginPage(BasePage):
         return self
 
     @allure.step("Выполнить вход и дождаться перехода: {email}")
-    def login_and_wait(self, email, password, timeout=10):
+    def login_and_wait(self, email, password, timeout=None):
         """Выполнить вход и дождаться успешного перехода"""
         self.login(email, password)
         self.wait_for_successful_login(timeout)
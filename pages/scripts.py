@@ -0,0 +1,114 @@
+# JavaScript-сниппеты, выполняемые в браузере из Page Object
+
+# Видимость элемента с учетом стилей и размеров (общая часть сниппетов)
+_IS_VISIBLE = """
+function isVisible(el) {
+    if (typeof el.checkVisibility === "function") {
+        if (!el.checkVisibility({visibilityProperty: true, opacityProperty: true})) {
+            return false;
+        }
+    } else {
+        var style = window.getComputedStyle(el);
+        if (style.display === "none" || style.visibility === "hidden" || style.opacity === "0") {
+            return false;
+        }
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+# Пакетная проверка элементов: arguments[0] - список
+# [ключ, тип, селектор, суженный селектор, альтернативы], где тип - "css"
+# или "xpath". Сначала ищем по суженному селектору (если он есть), затем по
+# полному. Для каждого ключа возвращает состояние первого найденного элемента
+# и индекс сработавшей альтернативы CSS-объединения.
+PROBE_ELEMENTS = _IS_VISIBLE + """
+function findAll(kind, selector) {
+    if (kind === "xpath") {
+        var snapshot = document.evaluate(
+            selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(selector));
+}
+
+var result = {};
+arguments[0].forEach(function (probe) {
+    var nodes = probe[3] ? findAll(probe[1], probe[3]) : [];
+    var narrowed = nodes.length > 0;
+    if (!narrowed) {
+        nodes = findAll(probe[1], probe[2]);
+    }
+    var el = nodes[0];
+    result[probe[0]] = {
+        present: nodes.length > 0,
+        count: nodes.length,
+        visible: el ? isVisible(el) : false,
+        enabled: el ? !el.disabled : false,
+        text: el ? (el.innerText || el.value || "").trim() : null,
+        narrowed: narrowed,
+        matched: el ? (probe[4] || []).findIndex(function (alternative) {
+            return el.matches(alternative);
+        }) : -1
+    };
+});
+return result;
+"""
+
+# Сброс всех форм страницы к исходным значениям и снятие фокуса
+RESET_FORMS = """
+Array.prototype.forEach.call(document.forms, function (form) {
+    form.reset();
+});
+if (document.activeElement && document.activeElement !== document.body) {
+    document.activeElement.blur();
+}
+"""
+
+# Тайминги загрузки текущего документа (Navigation Timing, миллисекунды)
+NAVIGATION_TIMING = """
+var entry = performance.getEntriesByType("navigation")[0];
+if (!entry) {
+    return null;
+}
+return {
+    url: entry.name,
+    response_end: entry.responseEnd,
+    dom_content_loaded: entry.domContentLoadedEventEnd,
+    load: entry.loadEventEnd,
+    transfer_size: entry.transferSize,
+    resources: performance.getEntriesByType("resource").length
+};
+"""
+
+# Снимок DOM для проверок без браузера: копия документа, где у каждого
+# элемента в data-snapshot-* записаны видимость, доступность, текущее
+# значение поля и габариты (x, y, ширина, высота в CSS-пикселях).
+DOM_SNAPSHOT = _IS_VISIBLE + """
+var root = document.documentElement;
+var clone = root.cloneNode(true);
+var elements = [root].concat(Array.prototype.slice.call(root.querySelectorAll("*")));
+var copies = [clone].concat(Array.prototype.slice.call(clone.querySelectorAll("*")));
+elements.forEach(function (el, i) {
+    var copy = copies[i];
+    var rect = el.getBoundingClientRect();
+    copy.setAttribute("data-snapshot-visible", isVisible(el) ? "1" : "0");
+    copy.setAttribute(
+        "data-snapshot-rect",
+        [rect.x, rect.y, rect.width, rect.height].map(Math.round).join(",")
+    );
+    if ("disabled" in el) {
+        copy.setAttribute("data-snapshot-enabled", el.disabled ? "0" : "1");
+    }
+    if (typeof el.value === "string") {
+        copy.setAttribute("data-snapshot-value", el.value);
+    }
+});
+return {url: location.href, title: document.title, html: clone.outerHTML};
+"""
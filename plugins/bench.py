@@ -0,0 +1,188 @@
+import json
+import math
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from config import Config
+from plugins.scheduling import split_group
+
+BASELINE_VERSION = 1
+PERCENTILES = (50, 90, 95)
+_ITERATION = re.compile(r"bench-(\d+)\]$")
+
+
+def percentile(samples, value):
+    """Перцентиль методом ближайшего ранга"""
+    ordered = sorted(samples)
+    # Умножаем до деления, чтобы не ловить ошибку округления float (7 * 100 / 100)
+    index = max(0, min(len(ordered) - 1, math.ceil(value * len(ordered) / 100) - 1))
+    return ordered[index]
+
+
+def iteration_key(nodeid):
+    """Номер итерации бенчмарка по nodeid (None - тест не повторяется)"""
+    # Суффикс группы планировщика (``@группа``) к итерации не относится
+    nodeid, _ = split_group(nodeid)
+    match = _ITERATION.search(nodeid)
+    return match.group(1) if match else None
+
+
+def summarize(samples):
+    """Сводка по выборке: количество, перцентили, максимум"""
+    summary = {"count": len(samples)}
+    for value in PERCENTILES:
+        summary[f"p{value}"] = round(percentile(samples, value), 4)
+    summary["max"] = round(max(samples), 4)
+    return summary
+
+
+def find_regressions(metrics, baseline, threshold, min_delta):
+    """Метрики, у которых p50 вырос больше порога относительно базовой линии"""
+    regressions = {}
+    for name, current in metrics.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        delta = current["p50"] - previous["p50"]
+        if delta > min_delta and current["p50"] > previous["p50"] * (1 + threshold):
+            regressions[name] = (previous["p50"], current["p50"])
+    return regressions
+
+
+class BenchRecorder:
+    """Сбор метрик бенчмарка на контроллере (или в единственном процессе)"""
+
+    def __init__(self, config):
+        self.config = config
+        self.samples = {}
+        self.iterations = {}
+        self.started_at = time.perf_counter()
+        self.regressions = {}
+        self.metrics = {}
+
+    def _add(self, name, value):
+        self.samples.setdefault(name, []).append(value)
+
+    def pytest_runtest_logreport(self, report):
+        iteration = iteration_key(report.nodeid)
+        if iteration is None:
+            return
+        phase = {"setup": "fixture_setup", "call": "test_call", "teardown": "fixture_teardown"}
+        self._add(phase[report.when], report.duration)
+        self.iterations[iteration] = self.iterations.get(iteration, 0.0) + report.duration
+
+    def _collect_timings(self):
+        """Время старта драйвера и методов BasePage из файлов таймингов"""
+        for path in Path(Config.TIMINGS_DIR).glob("*.json"):
+            data = json.loads(path.read_text(encoding="utf-8"))
+            for entry in data["entries"]:
+                if entry["kind"] == "driver":
+                    self._add("driver_startup", entry["duration"])
+                elif entry["kind"] == "method":
+                    self._add(f"method:{entry['name']}", entry["duration"])
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        if not self.iterations:
+            return
+        self._collect_timings()
+        for iteration_time in self.iterations.values():
+            self._add("iteration", iteration_time)
+        self.metrics = {name: summarize(values) for name, values in self.samples.items() if values}
+        self.metrics["wall_time"] = summarize([time.perf_counter() - self.started_at])
+
+        report = {
+            "version": BASELINE_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "base_url": Config.BASE_URL,
+            "runs": self.config.getoption("bench_runs"),
+            "metrics": self.metrics,
+        }
+        report_path = Path(Config.BENCH_REPORT_DIR) / "latest.json"
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+        baseline_path = Path(Config.BENCH_BASELINE_FILE)
+        if self.config.getoption("bench_save_baseline"):
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(
+                json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            return
+        if not baseline_path.is_file():
+            return
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        if baseline.get("version") != BASELINE_VERSION:
+            return
+        self.regressions = find_regressions(
+            self.metrics,
+            baseline["metrics"],
+            self.config.getoption("bench_threshold"),
+            Config.BENCH_MIN_DELTA,
+        )
+        if self.regressions:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.metrics:
+            return
+        terminalreporter.write_sep("-", "Бенчмарк")
+        header = " ".join(f"{f'p{value}, с':>9}" for value in PERCENTILES)
+        terminalreporter.write_line(f"{'замеров':>8} {header} {'макс, с':>9}  метрика")
+        for name, item in sorted(self.metrics.items()):
+            values = " ".join(f"{item[f'p{value}']:9.3f}" for value in PERCENTILES)
+            terminalreporter.write_line(f"{item['count']:8d} {values} {item['max']:9.3f}  {name}")
+        if self.config.getoption("bench_save_baseline"):
+            terminalreporter.write_line(f"Базовая линия сохранена: {Config.BENCH_BASELINE_FILE}")
+        for name, (previous, current) in self.regressions.items():
+            terminalreporter.write_line(
+                f"РЕГРЕССИЯ {name}: p50 {previous:.3f} с -> {current:.3f} с", red=True
+            )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "Бенчмарк набора тестов")
+    group.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="Запустить тесты в режиме бенчмарка",
+    )
+    group.addoption(
+        "--bench-runs",
+        type=int,
+        default=Config.BENCH_RUNS,
+        help="Сколько раз прогнать каждый тест (по умолчанию BENCH_RUNS)",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=Config.BENCH_THRESHOLD,
+        help="Допустимый рост p50 относительно базовой линии, доля (по умолчанию BENCH_THRESHOLD)",
+    )
+    group.addoption(
+        "--bench-save-baseline",
+        action="store_true",
+        default=False,
+        help="Сохранить результаты как новую базовую линию",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("bench") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(BenchRecorder(config), "bench_recorder")
+
+
+def pytest_generate_tests(metafunc):
+    # Повторяются только UI-тесты: юнит-тесты инфраструктуры в замеры не входят
+    if not metafunc.config.getoption("bench") or "browser" not in metafunc.fixturenames:
+        return
+    runs = metafunc.config.getoption("bench_runs")
+    metafunc.fixturenames.append("bench_iteration")
+    metafunc.parametrize(
+        "bench_iteration", range(1, runs + 1), ids=[f"bench-{run}" for run in range(1, runs + 1)]
+    )
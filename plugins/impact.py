@@ -0,0 +1,102 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from config import Config
+from plugins.scheduling import split_group
+from utils import impact
+
+
+touched_key = pytest.StashKey[dict]()
+
+
+def _report_dir():
+    return Path(Config.IMPACT_REPORT_DIR)
+
+
+def _load_map():
+    path = Path(Config.IMPACT_MAP_FILE)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--impact-base",
+        metavar="REF",
+        default=None,
+        help="запустить только тесты, затронутые изменениями относительно git-ревизии REF",
+    )
+
+
+def pytest_configure(config):
+    # Старые частичные карты удаляет только контроллер (или единственный процесс)
+    if not hasattr(config, "workerinput"):
+        shutil.rmtree(_report_dir(), ignore_errors=True)
+    config.stash[touched_key] = {}
+
+
+@pytest.fixture(autouse=True)
+def impact_recorder(request):
+    """Запись методов Page Object и локаторов, затронутых тестом"""
+    impact.start()
+    yield
+    nodeid, _ = split_group(request.node.nodeid)
+    request.config.stash[touched_key][nodeid] = sorted(impact.stop())
+
+
+def pytest_collection_modifyitems(config, items):
+    base = config.getoption("impact_base")
+    if not base:
+        return
+    try:
+        changes = impact.changed_lines(base, cwd=config.rootpath)
+    except (OSError, subprocess.CalledProcessError) as error:
+        config.issue_config_time_warning(
+            pytest.PytestWarning(f"Анализ изменений недоступен, запускаются все тесты: {error}"),
+            stacklevel=2,
+        )
+        return
+    change_set = impact.ChangeSet(changes, cwd=config.rootpath)
+    impact_map = _load_map()
+
+    selected, deselected = [], []
+    for item in items:
+        nodeid, _ = split_group(item.nodeid)
+        touched = impact_map.get(nodeid)
+        if change_set.affects(nodeid, item.fixturenames, None if touched is None else set(touched)):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_sessionfinish(session):
+    touched = session.config.stash[touched_key]
+    if touched:
+        workerinput = getattr(session.config, "workerinput", {})
+        path = _report_dir() / f"{workerinput.get('workerid', 'main')}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(touched, ensure_ascii=False, indent=2), encoding="utf-8")
+    if hasattr(session.config, "workerinput") or not _report_dir().is_dir():
+        return
+
+    # Контроллер обновляет карту только для выполненных тестов
+    impact_map = _load_map()
+    for path in _report_dir().glob("*.json"):
+        impact_map.update(json.loads(path.read_text(encoding="utf-8")))
+    path = Path(Config.IMPACT_MAP_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(dict(sorted(impact_map.items())), ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
@@ -0,0 +1,65 @@
+import json
+import shutil
+from pathlib import Path
+
+from config import Config
+from utils import locator_cache
+
+
+def _report_dir():
+    return Path(Config.LOCATOR_REPORT_DIR)
+
+
+def pytest_configure(config):
+    if not Config.LOCATOR_CACHE:
+        return
+    locator_cache.enable(Config.LOCATOR_CACHE_FILE)
+    # Старые отчеты удаляет только контроллер (или единственный процесс)
+    if not hasattr(config, "workerinput"):
+        shutil.rmtree(_report_dir(), ignore_errors=True)
+
+
+def pytest_sessionfinish(session):
+    cache = locator_cache.current()
+    if cache is None or not cache.stats:
+        return
+    cache.save()
+    workerinput = getattr(session.config, "workerinput", {})
+    path = _report_dir() / f"{workerinput.get('workerid', 'main')}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache.stats, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Вывести стоимость поиска по локаторам и неработающие альтернативы"""
+    if hasattr(config, "workerinput") or not _report_dir().is_dir():
+        return
+    stats = {}
+    for path in _report_dir().glob("*.json"):
+        for name, item in json.loads(path.read_text(encoding="utf-8")).items():
+            total = stats.setdefault(name, dict.fromkeys(item, 0))
+            for key, value in item.items():
+                total[key] = value if key == "selector" else total[key] + value
+    if not stats:
+        return
+
+    terminalreporter.write_sep("-", "Поиск по локаторам")
+    terminalreporter.write_line(
+        f"{'поисков':>8} {'ср., мс':>8} {'суженных':>9} {'полных':>7} {'промахов':>9}  локатор"
+    )
+    for name, item in sorted(stats.items(), key=lambda pair: pair[1]["time"], reverse=True):
+        average = item["time"] / item["lookups"] * 1000
+        terminalreporter.write_line(
+            f"{item['lookups']:8d} {average:8.1f} {item['narrowed']:9d} "
+            f"{item['full']:7d} {item['misses']:9d}  {name}"
+        )
+
+    cache = locator_cache.LocatorCache(Config.LOCATOR_CACHE_FILE)
+    names = {selector: name for (_, selector), name in locator_cache.locator_names().items()}
+    dead = locator_cache.dead_alternatives(cache.hits)
+    if dead:
+        terminalreporter.write_line("Альтернативы, не сработавшие ни разу:")
+        for selector, alternatives in dead.items():
+            terminalreporter.write_line(
+                f"  {names.get(selector, selector)}: {', '.join(alternatives)}"
+            )
@@ -0,0 +1,113 @@
+import json
+import shutil
+from pathlib import Path
+
+import allure
+import psutil
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from config import Config
+from utils import resources, timings
+
+records_key = pytest.StashKey[list]()
+
+
+def _report_dir():
+    return Path(Config.RESOURCE_REPORT_DIR)
+
+
+def _item_driver(item):
+    """Браузер теста: из фикстуры driver или из страницы login_page"""
+    driver = item.funcargs.get("driver")
+    if driver is None and "login_page" in item.funcargs:
+        driver = item.funcargs["login_page"].driver
+    return driver
+
+
+def _sample(driver):
+    try:
+        return timings.measure("telemetry", "resources", resources.sample, driver)
+    except (WebDriverException, psutil.Error):
+        return None
+
+
+def pytest_configure(config):
+    config.stash[records_key] = []
+    # Старые профили удаляет только контроллер (или единственный процесс)
+    if Config.RESOURCE_TELEMETRY and not hasattr(config, "workerinput"):
+        shutil.rmtree(_report_dir(), ignore_errors=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    driver = _item_driver(item) if Config.RESOURCE_TELEMETRY else None
+    before = _sample(driver) if driver is not None else None
+
+    yield
+
+    after = _sample(driver) if before is not None else None
+    if after is None:
+        return
+    record = resources.compare(
+        before,
+        after,
+        heap_growth=Config.RESOURCE_HEAP_GROWTH_MB * 2**20,
+        nodes_growth=Config.RESOURCE_NODES_GROWTH,
+    )
+    record = {"nodeid": item.nodeid, **record}
+    item.config.stash[records_key].append(record)
+    allure.attach(
+        json.dumps(record, ensure_ascii=False, indent=2),
+        name="Ресурсы браузера",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    if record["flags"]:
+        allure.dynamic.tag("resource-growth")
+
+
+def pytest_sessionfinish(session):
+    records = session.config.stash[records_key]
+    if not records:
+        return
+    workerinput = getattr(session.config, "workerinput", {})
+    path = _report_dir() / "workers" / f"{workerinput.get('workerid', 'main')}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Вывести рост ресурсов по тестам и оценку числа воркеров"""
+    workers_dir = _report_dir() / "workers"
+    if hasattr(config, "workerinput") or not workers_dir.is_dir():
+        return
+    records = {}
+    for path in sorted(workers_dir.glob("*.json")):
+        records[path.stem] = json.loads(path.read_text(encoding="utf-8"))
+    if not records:
+        return
+
+    workers = {name: resources.worker_profile(items) for name, items in records.items()}
+    capacity = resources.machine_capacity(workers)
+    flagged = [record for items in records.values() for record in items if record["flags"]]
+    profile = {"workers": workers, "capacity": capacity, "flagged": flagged}
+    path = _report_dir() / "profile.json"
+    path.write_text(json.dumps(profile, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    terminalreporter.write_sep("-", "Ресурсы браузеров")
+    terminalreporter.write_line(f"{'тестов':>7} {'пик RSS, МБ':>12} {'CPU, ядер':>10}  воркер")
+    for name, worker in workers.items():
+        terminalreporter.write_line(
+            f"{worker['tests']:7d} {worker['peak_rss'] / 2**20:12.0f} "
+            f"{worker['cpu_cores']:10.2f}  {name}"
+        )
+    terminalreporter.write_line(
+        f"Воркеров на этой машине ({capacity['cpu_count']} CPU, "
+        f"{capacity['memory_total'] / 2**30:.1f} ГБ): по памяти {capacity['workers_by_memory']}, "
+        f"по CPU {capacity['workers_by_cpu']}"
+    )
+    if flagged:
+        terminalreporter.write_line("Рост JS heap / DOM сверх порога:")
+        for record in flagged:
+            terminalreporter.write_line(f"  {record['nodeid']}: {', '.join(record['flags'])}")
+    terminalreporter.write_line(f"Профиль ресурсов: {path}")
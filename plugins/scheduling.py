@@ -0,0 +1,252 @@
+import heapq
+import json
+from pathlib import Path
+
+import pytest
+from allure_commons.utils import md5
+from xdist.scheduler import LoadScopeScheduling
+
+from config import Config
+from utils.driver_factory import FACTORIES
+
+# Тесты с общими дорогими фикстурами выполняются на одном воркере
+GROUP_FIXTURES = {
+    "logged_in_driver": "logged_in",
+}
+
+predicted_makespan_key = pytest.StashKey[float]()
+
+
+def split_group(nodeid):
+    """Разделить nodeid на исходный nodeid и группу (после ``@``)"""
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        nodeid, group = nodeid.rsplit("@", 1)
+        return nodeid, group
+    return nodeid, None
+
+
+def allure_history_id(nodeid):
+    """historyId Allure по nodeid теста.
+
+    Поддерживаются непараметризованные тесты и тесты, параметризованные
+    только браузером (``test_x[firefox]``); для остальных - None.
+    """
+    path, *names = nodeid.split("::")
+    name, _, param = names[-1].partition("[")
+    param = param.rstrip("]")
+    if param and param not in FACTORIES:
+        return None
+    package = path[: -len(".py")].replace("/", ".")
+    class_part = "".join(f".{part}" for part in names[:-1])
+    full_name = f"{package}{class_part}#{name}"
+    return md5(full_name, param) if param else md5(full_name)
+
+
+class DurationStore:
+    """Длительности тестов из прошлых прогонов.
+
+    Основной источник - локальный файл ``Config.DURATIONS_FILE``, который
+    обновляется после каждого прогона. Если теста там нет, используется
+    история Allure (``history.json`` в ``Config.ALLURE_HISTORY_DIR``).
+    """
+
+    def __init__(self, path, allure_history_dir=None):
+        self.path = Path(path)
+        self.durations = self._load_json(self.path)
+        self.history = {}
+        if allure_history_dir:
+            history = self._load_json(Path(allure_history_dir) / "history.json")
+            for history_id, entry in history.items():
+                times = [
+                    item["time"]["duration"] / 1000
+                    for item in entry.get("items", [])
+                    if item.get("time", {}).get("duration")
+                ]
+                if times:
+                    self.history[history_id] = sum(times) / len(times)
+
+    @staticmethod
+    def _load_json(path):
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, nodeid):
+        """Ожидаемая длительность теста в секундах"""
+        nodeid, _ = split_group(nodeid)
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        history_id = allure_history_id(nodeid)
+        if history_id in self.history:
+            return self.history[history_id]
+        return Config.DEFAULT_TEST_DURATION
+
+    def update(self, measured):
+        """Обновить длительности (скользящее среднее) и сохранить файл"""
+        for nodeid, duration in measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = round(
+                duration if previous is None else (previous + duration) / 2, 3
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(self.durations, ensure_ascii=False, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+
+
+def predict_makespan(unit_durations, workers):
+    """Makespan жадного распределения «самые долгие - первыми» (LPT)"""
+    loads = [0.0] * max(1, workers)
+    for duration in sorted(unit_durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """Планировщик xdist: группы тестов выдаются воркерам от самых долгих.
+
+    Единица работы - тест либо группа тестов (суффикс ``@группа`` в nodeid,
+    см. ``item_groups()``): с общей дорогой фикстурой или одного браузера.
+    """
+
+    def __init__(self, config, log, store):
+        super().__init__(config, log)
+        self.store = store
+
+    def _split_scope(self, nodeid):
+        nodeid, group = split_group(nodeid)
+        return group or nodeid
+
+    def _unit_duration(self, scope):
+        return sum(self.store.get(nodeid) for nodeid in self.workqueue[scope])
+
+    def _assign_work_unit(self, node):
+        # Самую долгую единицу работы ставим в начало очереди
+        longest = max(self.workqueue, key=self._unit_duration)
+        self.workqueue.move_to_end(longest, last=False)
+        super()._assign_work_unit(node)
+
+    def schedule(self):
+        first_run = self.collection is None
+        super().schedule()
+        if not first_run or not self.collection:
+            return
+        units = {}
+        for nodeid in self.collection:
+            scope = self._split_scope(nodeid)
+            units[scope] = units.get(scope, 0.0) + self.store.get(nodeid)
+        workers = min(len(self.nodes), len(units))
+        self.config.stash[predicted_makespan_key] = predict_makespan(units.values(), workers)
+
+
+class DurationRecorder:
+    """Сбор фактических длительностей тестов на контроллере (или в единственном процессе)"""
+
+    def __init__(self, config):
+        self.config = config
+        self.durations = {}
+        self.worker_times = {}
+
+    def pytest_runtest_logreport(self, report):
+        # Суммируем setup + call + teardown по тесту и по воркеру
+        nodeid, _ = split_group(report.nodeid)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        self.worker_times[worker] = self.worker_times.get(worker, 0.0) + report.duration
+
+    def pytest_sessionfinish(self):
+        if self.durations:
+            DurationStore(Config.DURATIONS_FILE).update(self.durations)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        predicted = self.config.stash.get(predicted_makespan_key, None)
+        if predicted is None or not self.worker_times:
+            return
+        terminalreporter.write_sep("-", "Планирование по длительности")
+        terminalreporter.write_line(
+            f"Makespan: прогноз {predicted:.1f} с, "
+            f"фактически {max(self.worker_times.values()):.1f} с "
+            f"({len(self.worker_times)} воркеров)"
+        )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=False,
+        help="Распределять тесты по воркерам xdist с учетом длительностей прошлых прогонов",
+    )
+
+
+def pytest_configure(config):
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(config), "duration_recorder")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("duration_schedule"):
+        return None
+    store = DurationStore(Config.DURATIONS_FILE, Config.ALLURE_HISTORY_DIR)
+    return DurationScheduling(config, log, store)
+
+
+def _item_browser(item):
+    """Браузер теста при запуске в нескольких браузерах (иначе None)"""
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("browser") if callspec else None
+
+
+def item_groups(items, workers):
+    """Группы тестов {nodeid: группа} для распределения по воркерам.
+
+    Тесты с общей дорогой фикстурой (``GROUP_FIXTURES``) идут одной группой.
+    При нескольких браузерах браузер входит в группу: тесты одного браузера
+    делятся на ``workers // число браузеров`` групп, чтобы воркер не
+    переключался между браузерами (и не перезапускал фабрику и пул) на
+    каждом тесте.
+    """
+    browsers = sorted({_item_browser(item) for item in items} - {None})
+    shards = max(1, workers // max(1, len(browsers)))
+    counters = dict.fromkeys(browsers, 0)
+    groups = {}
+    for item in items:
+        browser = _item_browser(item)
+        group = next(
+            (group for fixture, group in GROUP_FIXTURES.items() if fixture in item.fixturenames),
+            None,
+        )
+        if group and browser:
+            group = f"{group}-{browser}"
+        elif browser:
+            group = f"{browser}-{counters[browser] % shards}"
+            counters[browser] += 1
+        if group:
+            groups[item.nodeid] = group
+    return groups
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Группы проставляют воркеры: контроллер xdist сам тесты не собирает
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return
+    duration_schedule = config.getoption("duration_schedule")
+    # На воркере xdist заменяет dist на "no" и сохраняет признак loadgroup
+    if not duration_schedule and not config.getvalue("loadgroup"):
+        return
+    groups = item_groups(items, workerinput["workercount"])
+    for item in items:
+        group = groups.get(item.nodeid)
+        if group is None:
+            continue
+        if duration_schedule:
+            item._nodeid = f"{item.nodeid}@{group}"
+        else:
+            # При --dist loadgroup суффикс группы по маркеру добавит сам xdist
+            item.add_marker(pytest.mark.xdist_group(group))
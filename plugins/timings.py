@@ -0,0 +1,86 @@
+import json
+import re
+import shutil
+from pathlib import Path
+
+import allure
+import pytest
+
+from config import Config
+from utils import timings
+
+
+def _timings_dir():
+    return Path(Config.TIMINGS_DIR)
+
+
+def _timing_path(nodeid):
+    """Файл с таймингами теста"""
+    return _timings_dir() / (re.sub(r"[^\w.-]+", "_", nodeid).strip("_") + ".json")
+
+
+def pytest_configure(config):
+    # Старые замеры удаляет только контроллер (или единственный процесс)
+    if not hasattr(config, "workerinput"):
+        shutil.rmtree(_timings_dir(), ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def command_timings(request):
+    """Замер времени команд WebDriver, ожиданий и методов Page Object"""
+    recorder = timings.TimingRecorder().start()
+
+    yield recorder
+
+    recorder.stop()
+    report = json.dumps(
+        {"nodeid": request.node.nodeid, **recorder.to_dict()},
+        ensure_ascii=False,
+        indent=2,
+    )
+    path = _timing_path(request.node.nodeid)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report, encoding="utf-8")
+    allure.attach(
+        report,
+        name="Тайминги команд",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Вывести самые долгие шаги за весь прогон"""
+    if hasattr(config, "workerinput") or not _timings_dir().is_dir():
+        return
+    totals = {}
+    page_loads = {}
+    for path in _timings_dir().glob("*.json"):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        profile = data.get("perf_profile", "default")
+        page_loads.setdefault(profile, []).extend(
+            load for load in data.get("page_loads", []) if load
+        )
+        for key, item in data["summary"].items():
+            total = totals.setdefault(key, {"count": 0, "total": 0.0, "max": 0.0})
+            total["count"] += item["count"]
+            total["total"] += item["total"]
+            total["max"] = max(total["max"], item["max"])
+    if not totals:
+        return
+    slowest = sorted(totals.items(), key=lambda pair: pair[1]["total"], reverse=True)
+    terminalreporter.write_sep("-", f"Самые долгие шаги (топ {Config.TIMINGS_TOP})")
+    terminalreporter.write_line(f"{'всего, с':>9} {'макс, с':>8} {'вызовов':>8}  шаг")
+    for key, item in slowest[: Config.TIMINGS_TOP]:
+        terminalreporter.write_line(
+            f"{item['total']:9.2f} {item['max']:8.2f} {item['count']:8d}  {key}"
+        )
+    for profile, loads in page_loads.items():
+        if not loads:
+            continue
+        dom_ready = sum(load["dom_content_loaded"] for load in loads) / len(loads)
+        loaded = sum(load["load"] for load in loads) / len(loads)
+        terminalreporter.write_line(
+            f"Загрузка страниц (профиль {profile}): {len(loads)} шт., "
+            f"DOMContentLoaded {dom_ready:.0f} мс, load {loaded:.0f} мс в среднем"
+        )
+    terminalreporter.write_line(f"Тайминги по тестам: {_timings_dir()}")
@@ -0,0 +1,72 @@
+import os
+import time
+
+import allure
+
+from utils.auth_state import AuthStateCache
+
+
+class _Driver:
+    """Браузер, открытый на странице origin после входа"""
+
+    def __init__(self, origin):
+        self.origin = origin
+
+    def execute_script(self, script, *args):
+        return {"origin": self.origin, "local_storage": {"auth": "1"}, "session_storage": {}}
+
+    def get_cookies(self):
+        return [{"name": "session", "value": self.origin}]
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Снимок авторизации")
+class TestAuthStateCache:
+    """Тесты снимка авторизованного состояния"""
+
+    def test_workers_with_different_origins(self, tmp_path):
+        path = tmp_path / "storage_state.json"
+        first, second = "http://127.0.0.1:8001", "http://127.0.0.1:8002"
+        AuthStateCache(path, ttl=60).capture(_Driver(first))
+        AuthStateCache(path, ttl=60).capture(_Driver(second))
+
+        # Чужой снимок не виден и не удаляется
+        cache = AuthStateCache(path, ttl=60)
+        assert cache.get("http://127.0.0.1:8003") is None
+        assert cache.get(first)["cookies"] == [{"name": "session", "value": first}]
+        assert cache.get(second)["cookies"] == [{"name": "session", "value": second}]
+        assert len(list(tmp_path.glob("storage_state-*.json"))) == 2
+
+    def test_expired_snapshot(self, tmp_path):
+        origin = "http://127.0.0.1:8001"
+        cache = AuthStateCache(tmp_path / "storage_state.json", ttl=60)
+        cache.capture(_Driver(origin))
+        cache._states[origin]["created_at"] -= 120
+
+        assert cache.get(origin) is None
+        assert not cache.path_for(origin).exists()
+
+    def test_invalidate_only_own_origin(self, tmp_path):
+        path = tmp_path / "storage_state.json"
+        first, second = "http://127.0.0.1:8001", "http://127.0.0.1:8002"
+        AuthStateCache(path, ttl=60).capture(_Driver(second))
+        cache = AuthStateCache(path, ttl=60)
+        cache.capture(_Driver(first))
+
+        cache.invalidate(first)
+
+        assert cache.get(first) is None
+        assert cache.get(second) is not None
+
+    def test_capture_removes_stale_files(self, tmp_path):
+        stale = tmp_path / "storage_state-127.0.0.1_8009.json"
+        stale.write_text("{}", encoding="utf-8")
+        old = time.time() - 120
+        os.utime(stale, (old, old))
+
+        AuthStateCache(tmp_path / "storage_state.json", ttl=60).capture(
+            _Driver("http://127.0.0.1:8001")
+        )
+
+        assert not stale.exists()
+        assert (tmp_path / "storage_state-127.0.0.1_8001.json").exists()
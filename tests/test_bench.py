@@ -0,0 +1,42 @@
+import allure
+import pytest
+
+from plugins.bench import iteration_key, percentile
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Бенчмарк")
+class TestPercentile:
+    """Тесты перцентилей методом ближайшего ранга"""
+
+    @pytest.mark.parametrize(
+        "value, expected", [(50, 5), (90, 9), (95, 10), (100, 10), (0, 1), (10, 1), (11, 2)]
+    )
+    def test_nearest_rank(self, value, expected):
+        assert percentile(range(10, 0, -1), value) == expected
+
+    def test_single_sample(self):
+        assert percentile([0.3], 95) == 0.3
+
+    def test_float_rounding(self):
+        assert percentile(range(1, 101), 7) == 7
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Бенчмарк")
+class TestIterationKey:
+    """Тесты номера итерации по nodeid"""
+
+    @pytest.mark.parametrize(
+        "nodeid, expected",
+        [
+            ("tests/test_login.py::TestLogin::test_a[bench-1]", "1"),
+            ("tests/test_login.py::TestLogin::test_a[chrome-bench-12]", "12"),
+            ("tests/test_login.py::TestLogin::test_a[chrome-bench-1]@chrome-0", "1"),
+            ("tests/test_login.py::TestLogin::test_a[bench-2]@logged_in-firefox", "2"),
+            ("tests/test_login.py::TestLogin::test_a", None),
+            ("tests/test_bench.py::TestPercentile::test_nearest_rank[50-5]", None),
+        ],
+    )
+    def test_iteration_key(self, nodeid, expected):
+        assert iteration_key(nodeid) == expected
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from locators import BasePageLocators, LoginPageLocators
+from pages.login_page import LoginPage
+from utils.dom_snapshot import DomSnapshot
+
+LOGIN_HTML = (Path(__file__).parent.parent / "local_app" / "templates" / "login.html").read_text(
+    encoding="utf-8"
+)
+
+
+def _snapshot(html=LOGIN_HTML):
+    # Перевод локаторов в CSS - тот же, что у Page Object
+    return DomSnapshot({"url": "/", "title": "", "html": html}, LoginPage(None)._css)
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Снимок DOM")
+class TestDomSnapshot:
+    """Тесты поиска по снимку DOM страницы входа"""
+
+    def test_find_all_css_union(self):
+        elements = _snapshot().find_all(LoginPageLocators.EMAIL_INPUT)
+        assert [element.get_attribute("id") for element in elements] == ["email"]
+
+    @pytest.mark.parametrize(
+        "locator, expected",
+        [
+            ((By.ID, "password"), ["password"]),
+            ((By.NAME, "email"), ["email"]),
+            ((By.TAG_NAME, "input"), ["email", "password"]),
+            ((By.XPATH, "//form//*[@id]"), ["email", "password", "login"]),
+        ],
+    )
+    def test_find_all_strategies(self, locator, expected):
+        assert [element.get_attribute("id") for element in _snapshot().find_all(locator)] == expected
+
+    def test_find_absent(self):
+        snapshot = _snapshot()
+        assert snapshot.find_all(LoginPageLocators.ERROR_MESSAGE) == []
+        assert snapshot.find(LoginPageLocators.ERROR_MESSAGE) is None
+        assert not snapshot.is_present(LoginPageLocators.ERROR_MESSAGE)
+
+    def test_unsupported_strategy(self):
+        with pytest.raises(ValueError):
+            _snapshot().find_all((By.LINK_TEXT, "Войти"))
+
+    def test_probe_dict(self):
+        result = _snapshot().probe(LoginPage.FORM_ELEMENTS)
+        assert set(result) == set(LoginPage.FORM_ELEMENTS)
+        assert result["login_button"] == {
+            "present": True,
+            "count": 1,
+            # Без атрибутов data-snapshot-* элемент считается невидимым
+            "visible": False,
+            "enabled": True,
+            "text": "Войти",
+        }
+
+    def test_probe_list(self):
+        locators = [BasePageLocators.LOADING_SPINNER, LoginPageLocators.PASSWORD_INPUT]
+        result = _snapshot().probe(locators)
+        assert list(result) == locators
+        assert result[BasePageLocators.LOADING_SPINNER] == {
+            "present": False,
+            "count": 0,
+            "visible": False,
+            "enabled": False,
+            "text": None,
+        }
+        assert result[LoginPageLocators.PASSWORD_INPUT]["present"]
+
+    def test_browser_state_attributes(self):
+        html = LOGIN_HTML.replace(
+            'id="email"',
+            'id="email" data-snapshot-visible="1" data-snapshot-value=" user@example.com "'
+            ' data-snapshot-rect="10,20,300,35"',
+        ).replace('id="login"', 'id="login" data-snapshot-enabled="0"')
+        snapshot = _snapshot(html)
+        email = snapshot.find(LoginPageLocators.EMAIL_INPUT)
+        assert email.visible
+        assert email.text == "user@example.com"
+        assert email.rect == (10, 20, 300, 35)
+        assert snapshot.is_visible(LoginPageLocators.EMAIL_INPUT)
+        assert not snapshot.find(LoginPageLocators.LOGIN_BUTTON).enabled
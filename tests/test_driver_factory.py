@@ -0,0 +1,46 @@
+import allure
+import pytest
+
+from utils import perf_profiles
+from utils.driver_factory import ChromeDriverFactory
+
+
+def _cache_args(options):
+    return [arg for arg in options.arguments if arg.startswith("--disk-cache-dir")]
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Фабрика браузеров")
+class TestChromeStaticCache:
+    """Тесты выбора дискового кэша статики Chrome"""
+
+    @pytest.fixture
+    def make_factory(self):
+        factories = []
+
+        def make(profile, use_template):
+            factory = ChromeDriverFactory(
+                perf_profiles.get_profile(profile),
+                use_template=use_template,
+                static_cache_dir="/tmp/static-cache",
+            )
+            factories.append(factory)
+            return factory
+
+        yield make
+
+        for factory in factories:
+            factory.close()
+
+    @pytest.mark.parametrize("profile", ["fast", "minimal"])
+    def test_template_keeps_cache_in_profile(self, make_factory, profile):
+        options = make_factory(profile, use_template=True)._options("/tmp/template")
+        assert _cache_args(options) == []
+
+    def test_without_template_uses_static_cache_dir(self, make_factory):
+        options = make_factory("fast", use_template=False)._options()
+        assert _cache_args(options) == ["--disk-cache-dir=/tmp/static-cache"]
+
+    def test_profile_without_static_cache(self, make_factory):
+        options = make_factory("default", use_template=False)._options()
+        assert _cache_args(options) == []
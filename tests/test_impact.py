@@ -0,0 +1,199 @@
+import subprocess
+
+import allure
+import pytest
+
+from utils import impact
+from utils.driver_pool import WarmPage
+
+PAGE = '''class LoginPage:
+    URL = "/"
+    FORM_ELEMENTS = {
+        "email": 1,
+    }
+
+    def open(self):
+        return self
+
+    def _helper(self):
+        return 1
+'''
+
+LOCATORS = '''class LoginPageLocators:
+    EMAIL_INPUT = ("css selector", "#email")
+    PASSWORD_INPUT = ("css selector", "#password")
+'''
+
+CONFTEST = '''import pytest
+
+
+@pytest.fixture
+def driver():
+    return 1
+
+
+def pytest_configure(config):
+    pass
+'''
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git-репозиторий со страницей, локаторами и conftest.py"""
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "login_page.py").write_text(PAGE, encoding="utf-8")
+    (tmp_path / "locators.py").write_text(LOCATORS, encoding="utf-8")
+    (tmp_path / "conftest.py").write_text(CONFTEST, encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _edit(path, old, new):
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+
+def _change_set(repo):
+    return impact.ChangeSet(impact.changed_lines("HEAD", cwd=repo), cwd=repo)
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Анализ влияния изменений")
+class TestImpact:
+    """Тесты выбора затронутых тестов по git diff"""
+
+    def test_changed_lines(self, repo):
+        _edit(repo / "locators.py", "#password", "#pass")
+        (repo / "tests.py").write_text("", encoding="utf-8")
+        (repo / "conftest.py").unlink()
+
+        changes = impact.changed_lines("HEAD", cwd=repo)
+
+        assert changes["locators.py"] == {3}
+        assert changes["tests.py"] is None
+        assert changes["conftest.py"] is None
+
+    def test_locator_attribute(self, repo):
+        _edit(repo / "locators.py", "#email", "#mail")
+
+        change_set = _change_set(repo)
+
+        assert change_set.symbols == {"LoginPageLocators.EMAIL_INPUT"}
+        assert change_set.affects("t::a", [], {"LoginPageLocators.EMAIL_INPUT"})
+        assert not change_set.affects("t::b", [], {"LoginPageLocators.PASSWORD_INPUT"})
+
+    def test_page_method(self, repo):
+        _edit(repo / "pages" / "login_page.py", "return self", "return None")
+
+        change_set = _change_set(repo)
+
+        assert change_set.symbols == {"LoginPage.open"}
+        assert change_set.affects("t::a", [], {"LoginPage.open"})
+        assert not change_set.affects("t::b", [], {"LoginPage.login"})
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [('"email": 1,', '"email": 1,\n        "password": 2,'), ('URL = "/"', 'URL = "/login"'),
+         ("return 1", "return 2")],
+        ids=["dict-attribute", "attribute", "private-method"],
+    )
+    def test_page_class_member_affects_whole_class(self, repo, old, new):
+        _edit(repo / "pages" / "login_page.py", old, new)
+
+        change_set = _change_set(repo)
+
+        assert change_set.symbols == {"LoginPage.*"}
+        assert change_set.affects("t::a", [], {"LoginPage.get_missing_form_elements"})
+        assert not change_set.affects("t::b", [], {"BasePage.open"})
+
+    def test_conftest_fixture(self, repo):
+        _edit(repo / "conftest.py", "return 1", "return 2")
+
+        change_set = _change_set(repo)
+
+        assert not change_set.run_all
+        assert change_set.fixtures == {"driver"}
+        assert change_set.affects("t::a", ["driver"], set())
+        assert not change_set.affects("t::b", ["other"], set())
+
+    def test_conftest_hook_runs_all(self, repo):
+        _edit(repo / "conftest.py", "pass", "config.option.verbose = 1")
+
+        assert _change_set(repo).run_all
+
+    def test_unmapped_and_changed_test_files(self, repo):
+        change_set = impact.ChangeSet({"tests/test_login.py": {5}}, cwd=repo)
+
+        assert change_set.affects("tests/test_login.py::TestLogin::test_a", [], set())
+        assert change_set.affects("tests/test_other.py::test_b", [], None)
+        assert not change_set.affects("tests/test_other.py::test_b", [], set())
+
+
+class _Driver:
+    def execute(self, command, params=None):
+        return {}
+
+
+class _Pool:
+    """Пул из одного браузера; replace=True - браузер «упал» и заменён"""
+
+    def __init__(self):
+        self.replace = False
+
+    def acquire(self):
+        return _Driver()
+
+    def reuse(self, driver):
+        return _Driver() if self.replace else driver
+
+
+class _Page:
+    def __init__(self, driver):
+        self.driver = driver
+
+
+def _open_page(driver):
+    impact.touch("LoginPage.open")
+    impact.touch("BasePage.open")
+    return _Page(driver)
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Анализ влияния изменений")
+class TestWarmPageImpact:
+    """Тесты записи влияния для общей прогретой страницы"""
+
+    def _get(self, warm_page):
+        impact.start()
+        warm_page.get()
+        return impact.stop()
+
+    def test_open_recorded_in_every_test(self):
+        pool = _Pool()
+        warm_page = WarmPage(pool, _open_page)
+
+        first = self._get(warm_page)
+        second = self._get(warm_page)
+        pool.replace = True
+        third = self._get(warm_page)
+
+        assert first == second == third == {"LoginPage.open", "BasePage.open"}
+
+    def test_capture_keeps_test_record(self):
+        impact.start()
+        impact.touch("BasePage.open")
+        with impact.capture() as touched:
+            impact.touch("LoginPage.open")
+
+        assert touched == {"LoginPage.open"}
+        assert impact.stop() == {"BasePage.open", "LoginPage.open"}
@@ -1,5 +1,5 @@
 import allure
-from pages.login_page import LoginPage
+import pytest
 
 
 @allure.epic("Аутентификация")
@@ -11,12 +11,10 @@ class TestLogin:
     @allure.title("Вход с валидными учетными данными")
     @allure.description("Проверка успешного входа пользователя с корректными данными")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_successful_login(self, driver):
+    def test_successful_login(self, login_page):
         """Тест успешного входа с валидными данными"""
-        login_page = LoginPage(driver)
-
-        with allure.step("Открыть страницу входа и выполнить вход"):
-            login_page.open().login("test@example.com", "password")
+        with allure.step("Выполнить вход"):
+            login_page.login("test@example.com", "password")
 
         with allure.step("Проверить успешный вход и переход на страницу проектов"):
             login_page.wait_for_successful_login()
@@ -29,12 +27,10 @@ class TestLogin:
     @allure.title("Проверка URL после успешного входа")
     @allure.description("Проверка корректности URL после успешной аутентификации")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_successful_login_url_check(self, driver):
+    def test_successful_login_url_check(self, login_page):
         """Тест проверки URL после успешного входа"""
-        login_page = LoginPage(driver)
-
-        with allure.step("Открыть страницу входа и выполнить вход"):
-            login_page.open().login_and_wait("test@example.com", "password")
+        with allure.step("Выполнить вход"):
+            login_page.login_and_wait("test@example.com", "password")
 
         with allure.step("Проверить корректность URL"):
             current_url = login_page.get_current_url()
@@ -49,12 +45,10 @@ class TestLogin:
         "Проверка что система не пропускает пользователя с неверными данными"
     )
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_login_with_invalid_credentials(self, driver):
+    def test_login_with_invalid_credentials(self, login_page):
         """Тест входа с неверными данными"""
-        login_page = LoginPage(driver)
-
         with allure.step("Попытка входа с неверными данными"):
-            login_page.open().login("wrong@example.com", "wrongpassword")
+            login_page.login("wrong@example.com", "wrongpassword")
 
         with allure.step("Проверить что вход не выполнен"):
             assert (
@@ -65,12 +59,10 @@ class TestLogin:
     @allure.title("Вход с пустыми полями")
     @allure.description("Проверка что система требует заполнения всех полей")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_login_with_empty_fields(self, driver):
+    def test_login_with_empty_fields(self, login_page):
         """Тест входа с пустыми полями"""
-        login_page = LoginPage(driver)
-
         with allure.step("Попытка входа без заполнения полей"):
-            login_page.open().click_login_button()
+            login_page.click_login_button()
 
         with allure.step("Проверить что остались на странице входа"):
             assert (
@@ -83,35 +75,22 @@ class TestLogin:
         "Проверка что все необходимые элементы присутствуют на странице"
     )
     @allure.severity(allure.severity_level.NORMAL)
-    def test_login_page_elements_present(self, driver):
+    @pytest.mark.readonly
+    def test_login_page_elements_present(self, login_page):
         """Тест наличия элементов на странице входа"""
-        login_page = LoginPage(driver)
-
-        with allure.step("Открыть страницу входа"):
-            login_page.open()
-
         with allure.step("Проверить наличие основных элементов"):
-            assert (
-                login_page.is_email_field_present()
-            ), "Поле email не найдено на странице"
-            assert (
-                login_page.is_password_field_present()
-            ), "Поле пароля не найдено на странице"
-            assert (
-                login_page.is_login_button_present()
-            ), "Кнопка входа не найдена на странице"
+            missing = login_page.get_missing_form_elements()
+            assert "email" not in missing, "Поле email не найдено на странице"
+            assert "password" not in missing, "Поле пароля не найдено на странице"
+            assert "login_button" not in missing, "Кнопка входа не найдена на странице"
 
     @allure.story("Проверка элементов интерфейса")
     @allure.title("Видимость элементов на странице входа")
     @allure.description("Проверка что все элементы видимы пользователю")
     @allure.severity(allure.severity_level.MINOR)
-    def test_login_page_elements_visible(self, driver):
+    @pytest.mark.readonly
+    def test_login_page_elements_visible(self, login_page):
         """Тест видимости элементов на странице входа"""
-        login_page = LoginPage(driver)
-
-        with allure.step("Открыть страницу входа"):
-            login_page.open()
-
         with allure.step("Проверить видимость всех элементов"):
             assert (
                 login_page.are_all_elements_visible()
@@ -121,12 +100,10 @@ class TestLogin:
     @allure.title("Вход с пустым email")
     @allure.description("Проверка валидации при отсутствии email")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_login_with_empty_email(self, driver):
+    def test_login_with_empty_email(self, login_page):
         """Тест входа с пустым email"""
-        login_page = LoginPage(driver)
-
         with allure.step("Ввести только пароль без email"):
-            login_page.open().enter_password("password").click_login_button()
+            login_page.enter_password("password").click_login_button()
 
         with allure.step("Проверить что остались на странице входа"):
             assert (
@@ -137,12 +114,10 @@ class TestLogin:
     @allure.title("Вход с пустым паролем")
     @allure.description("Проверка валидации при отсутствии пароля")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_login_with_empty_password(self, driver):
+    def test_login_with_empty_password(self, login_page):
         """Тест входа с пустым паролем"""
-        login_page = LoginPage(driver)
-
         with allure.step("Ввести только email без пароля"):
-            login_page.open().enter_email("test@example.com").click_login_button()
+            login_page.enter_email("test@example.com").click_login_button()
 
         with allure.step("Проверить что остались на странице входа"):
             assert (
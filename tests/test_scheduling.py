@@ -0,0 +1,128 @@
+import json
+from types import SimpleNamespace
+
+import allure
+import pytest
+from allure_commons.utils import md5
+
+from config import Config
+from plugins.scheduling import (
+    DurationStore,
+    allure_history_id,
+    item_groups,
+    predict_makespan,
+    split_group,
+)
+
+
+def _item(name, browser=None, fixtures=()):
+    callspec = SimpleNamespace(params={"browser": browser}) if browser else None
+    suffix = f"[{browser}]" if browser else ""
+    return SimpleNamespace(
+        nodeid=f"tests/test_login.py::TestLogin::{name}{suffix}",
+        fixturenames=["browser", *fixtures],
+        callspec=callspec,
+    )
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Планирование по длительности")
+class TestScheduling:
+    """Тесты распределения тестов по воркерам xdist"""
+
+    @pytest.mark.parametrize(
+        "nodeid, expected",
+        [
+            ("tests/test_login.py::TestLogin::test_a", ("tests/test_login.py::TestLogin::test_a", None)),
+            ("t.py::test_a@logged_in", ("t.py::test_a", "logged_in")),
+            ("t.py::test_a[chrome]@chrome-1", ("t.py::test_a[chrome]", "chrome-1")),
+            # «@» внутри параметров - не группа
+            ("t.py::test_a[user@example.com]", ("t.py::test_a[user@example.com]", None)),
+        ],
+    )
+    def test_split_group(self, nodeid, expected):
+        assert split_group(nodeid) == expected
+
+    @pytest.mark.parametrize(
+        "durations, workers, expected",
+        [
+            ([], 2, 0.0),
+            # LPT жадный: 5+3 и 4+3+3 (оптимум 9 не ищется)
+            ([5, 4, 3, 3, 3], 2, 10),
+            ([5, 4, 3, 3, 3], 1, 18),
+            ([1, 1], 4, 1),
+            ([2], 0, 2),
+        ],
+    )
+    def test_predict_makespan(self, durations, workers, expected):
+        assert predict_makespan(durations, workers) == expected
+
+    def test_allure_history_id(self):
+        full_name = "tests.test_login.TestLogin#test_a"
+
+        assert allure_history_id("tests/test_login.py::TestLogin::test_a") == md5(full_name)
+        assert allure_history_id("tests/test_login.py::TestLogin::test_a[firefox]") == md5(
+            full_name, "firefox"
+        )
+        assert allure_history_id("tests/test_login.py::test_b") == md5("tests.test_login#test_b")
+        assert allure_history_id("tests/test_login.py::TestLogin::test_a[bench-1]") is None
+
+    def test_item_groups_single_browser(self):
+        items = [_item("test_a"), _item("test_b", fixtures=["logged_in_driver"])]
+
+        assert item_groups(items, workers=4) == {items[1].nodeid: "logged_in"}
+
+    def test_item_groups_browsers_are_split_into_shards(self):
+        items = [_item(f"test_{n}", browser) for browser in ("chrome", "firefox") for n in range(4)]
+        items.append(_item("test_auth", "firefox", fixtures=["logged_in_driver"]))
+
+        groups = item_groups(items, workers=4)
+
+        assert [groups[item.nodeid] for item in items] == [
+            "chrome-0", "chrome-1", "chrome-0", "chrome-1",
+            "firefox-0", "firefox-1", "firefox-0", "firefox-1",
+            "logged_in-firefox",
+        ]
+
+    def test_item_groups_fewer_workers_than_browsers(self):
+        items = [_item("test_a", "chrome"), _item("test_a", "firefox")]
+
+        assert set(item_groups(items, workers=1).values()) == {"chrome-0", "firefox-0"}
+
+
+@allure.epic("Инфраструктура")
+@allure.feature("Планирование по длительности")
+class TestDurationStore:
+    """Тесты источников длительностей тестов"""
+
+    NODEID = "tests/test_login.py::TestLogin::test_a"
+
+    def _history(self, tmp_path, durations_ms):
+        history_id = allure_history_id(self.NODEID)
+        entry = {"items": [{"time": {"duration": value}} for value in durations_ms]}
+        (tmp_path / "history.json").write_text(json.dumps({history_id: entry}), encoding="utf-8")
+        return tmp_path
+
+    def test_local_file_first(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({self.NODEID: 1.5}), encoding="utf-8")
+        store = DurationStore(path, self._history(tmp_path, [9000]))
+
+        assert store.get(f"{self.NODEID}@logged_in") == 1.5
+
+    def test_allure_history_average(self, tmp_path):
+        store = DurationStore(tmp_path / "missing.json", self._history(tmp_path, [1000, 3000, 0]))
+
+        assert store.get(self.NODEID) == 2.0
+
+    def test_default_duration(self, tmp_path):
+        store = DurationStore(tmp_path / "missing.json")
+
+        assert store.get(self.NODEID) == Config.DEFAULT_TEST_DURATION
+
+    def test_update_moving_average(self, tmp_path):
+        path = tmp_path / "durations.json"
+        DurationStore(path).update({self.NODEID: 2.0})
+        DurationStore(path).update({self.NODEID: 4.0})
+
+        assert DurationStore(path).get(self.NODEID) == 3.0
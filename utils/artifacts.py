@@ -0,0 +1,116 @@
+import base64
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import allure_commons
+from allure_commons.model2 import Attachment
+from allure_commons.types import AttachmentType
+from allure_commons.utils import uuid4
+from selenium.common.exceptions import WebDriverException
+
+CAPTURE_NONE = "none"
+CAPTURE_URL = "url"
+CAPTURE_FULL = "full"
+
+
+class FailureArtifactWriter:
+    """Фоновая запись артефактов упавших тестов в Allure.
+
+    В потоке теста снимается только то, что требует живого браузера
+    (URL, сжатый скриншот, HTML), и вложения регистрируются в результате
+    теста. Декодирование и запись файлов в каталог Allure идут в фоновом
+    потоке. Одинаковые HTML и скриншоты записываются один раз, остальные
+    вложения ссылаются на тот же файл.
+    """
+
+    def __init__(self, level, html_max_bytes, screenshot_quality, screenshot_scale):
+        self.level = level
+        self.html_max_bytes = html_max_bytes
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_scale = screenshot_scale
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+        self._written = {}
+        self._lock = threading.Lock()
+
+    def capture(self, driver, reporter, name_suffix=""):
+        """Снять артефакты с браузера и поставить их запись в очередь"""
+        if self.level == CAPTURE_NONE or reporter is None:
+            return
+        self._attach(reporter, driver.current_url, "URL при ошибке", AttachmentType.TEXT)
+        if self.level != CAPTURE_FULL:
+            return
+
+        screenshot, mime = self._take_screenshot(driver)
+        self._attach(
+            reporter,
+            screenshot,
+            f"Скриншот_при_ошибке{name_suffix}",
+            mime,
+            decode=True,
+        )
+        self._attach(
+            reporter,
+            self._cap_html(driver.page_source),
+            "HTML страницы",
+            AttachmentType.HTML,
+        )
+
+    def _take_screenshot(self, driver):
+        """Скриншот в base64: JPEG с уменьшением через CDP или PNG как есть"""
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                metrics = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+                viewport = metrics["cssVisualViewport"]
+                result = driver.execute_cdp_cmd(
+                    "Page.captureScreenshot",
+                    {
+                        "format": "jpeg",
+                        "quality": self.screenshot_quality,
+                        "clip": {
+                            "x": viewport["pageX"],
+                            "y": viewport["pageY"],
+                            "width": viewport["clientWidth"],
+                            "height": viewport["clientHeight"],
+                            "scale": self.screenshot_scale,
+                        },
+                    },
+                )
+                return result["data"], AttachmentType.JPG
+            except WebDriverException:
+                pass
+        return driver.get_screenshot_as_base64(), AttachmentType.PNG
+
+    def _cap_html(self, html):
+        """Обрезать HTML до заданного размера"""
+        encoded = html.encode("utf-8")
+        if len(encoded) <= self.html_max_bytes:
+            return html
+        capped = encoded[: self.html_max_bytes].decode("utf-8", errors="ignore")
+        return f"{capped}\n<!-- HTML обрезан: {self.html_max_bytes} из {len(encoded)} байт -->"
+
+    def _attach(self, reporter, body, name, attachment_type, decode=False):
+        """Зарегистрировать вложение в тесте и записать файл в фоне (один раз)"""
+        mime, extension = attachment_type.value
+        digest = hashlib.sha1(body.encode("utf-8")).hexdigest()
+        test_result = reporter.get_test(None)
+        if test_result is None:
+            return
+        with self._lock:
+            file_name = self._written.get(digest)
+            is_new = file_name is None
+            if is_new:
+                file_name = f"{uuid4()}-attachment.{extension}"
+                self._written[digest] = file_name
+        test_result.attachments.append(Attachment(source=file_name, name=name, type=mime))
+        if is_new:
+            self._executor.submit(self._write, body, file_name, decode)
+
+    @staticmethod
+    def _write(body, file_name, decode):
+        data = base64.b64decode(body) if decode else body
+        allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=file_name)
+
+    def close(self):
+        """Дождаться записи всех артефактов"""
+        self._executor.shutdown(wait=True)
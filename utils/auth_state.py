@@ -0,0 +1,121 @@
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+_READ_STORAGE_SCRIPT = """
+function dump(storage) {
+    var data = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+}
+return {
+    origin: window.location.origin,
+    local_storage: dump(window.localStorage),
+    session_storage: dump(window.sessionStorage)
+};
+"""
+
+_WRITE_STORAGE_SCRIPT = """
+var state = arguments[0];
+Object.keys(state.local_storage).forEach(function (key) {
+    window.localStorage.setItem(key, state.local_storage[key]);
+});
+Object.keys(state.session_storage).forEach(function (key) {
+    window.sessionStorage.setItem(key, state.session_storage[key]);
+});
+"""
+
+
+class AuthStateCache:
+    """Снимок авторизованного состояния браузера на диске.
+
+    Снимок содержит cookies и local/session storage после входа и живёт
+    ``ttl`` секунд. Пока он свежий, тесты подставляют его в браузер и
+    открывают нужную страницу сразу, минуя форму входа.
+
+    У каждого origin свой файл рядом с ``path``: воркеры с локальной копией
+    приложения (у каждой свой порт) не затирают и не удаляют снимки друг
+    друга.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._states = {}
+
+    def path_for(self, origin):
+        """Файл снимка для origin"""
+        name = re.sub(r"[^A-Za-z0-9.-]+", "_", origin.split("://", 1)[-1]).strip("_")
+        return self.path.with_name(f"{self.path.stem}-{name}{self.path.suffix}")
+
+    def is_fresh(self, state):
+        """Проверить, что снимок не истёк"""
+        return time.time() - state.get("created_at", 0) < self.ttl
+
+    def get(self, origin):
+        """Получить актуальный снимок origin (из памяти или с диска) или None"""
+        state = self._states.get(origin)
+        path = self.path_for(origin)
+        if state is None and path.is_file():
+            try:
+                state = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                state = None
+        if state is None or state.get("origin") != origin:
+            return None
+        if not self.is_fresh(state):
+            self.invalidate(origin)
+            return None
+        self._states[origin] = state
+        return state
+
+    def capture(self, driver):
+        """Снять cookies и storage с текущей страницы и сохранить снимок"""
+        state = driver.execute_script(_READ_STORAGE_SCRIPT)
+        state["cookies"] = driver.get_cookies()
+        state["created_at"] = time.time()
+        path = self.path_for(state["origin"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Пишем через временный файл, чтобы воркеры не прочитали половину
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self._states[state["origin"]] = state
+        self._remove_expired()
+        return state
+
+    def _remove_expired(self):
+        """Удалить истёкшие снимки (например, от портов прошлых прогонов)"""
+        expired_before = time.time() - self.ttl
+        for path in self.path.parent.glob(f"{self.path.stem}-*{self.path.suffix}"):
+            try:
+                if path.stat().st_mtime < expired_before:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def inject(self, driver, state):
+        """Подставить снимок в браузер (браузер остаётся на origin снимка)"""
+        try:
+            driver.get(state["origin"])
+            for cookie in state["cookies"]:
+                driver.add_cookie(cookie)
+            driver.execute_script(_WRITE_STORAGE_SCRIPT, state)
+            return True
+        except WebDriverException:
+            return False
+
+    def invalidate(self, origin):
+        """Удалить снимок origin из памяти и с диска"""
+        self._states.pop(origin, None)
+        try:
+            self.path_for(origin).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,69 @@
+import contextlib
+import os
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: ограничения слотов недоступны
+    fcntl = None
+
+# Поддерживаются ли ограничения слотов на этой платформе
+LOCKS_AVAILABLE = fcntl is not None
+
+
+def parse_limits(value):
+    """Разобрать ограничения вида ``"chrome=4,firefox=2"`` в словарь.
+
+    При неверном формате - ``ValueError`` с понятным сообщением.
+    """
+    limits = {}
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        browser, _, limit = part.partition("=")
+        if not browser.strip() or not limit.strip().isdigit():
+            raise ValueError(f"ожидается браузер=число, получено {part!r}")
+        limits[browser.strip()] = int(limit)
+    return limits
+
+
+class BrowserSlots:
+    """Межпроцессный семафор на число одновременно выполняемых тестов браузера.
+
+    Каждому браузеру с ограничением соответствует набор файлов-слотов;
+    воркер xdist держит блокировку одного из них на время теста. Число
+    запущенных браузеров это не ограничивает: браузеры воркеров живут всю
+    сессию. Воркер без свободного слота ждёт его и другие тесты не берёт.
+    Браузеры без ограничения слотов не занимают. Блокировки - через
+    ``fcntl``, поэтому ограничения работают только на POSIX.
+    """
+
+    def __init__(self, directory, limits, poll_interval=0.1):
+        self.directory = Path(directory)
+        self.limits = limits
+        self.poll_interval = poll_interval
+
+    @contextlib.contextmanager
+    def acquire(self, browser):
+        """Занять слот браузера (ожидая, пока он освободится)"""
+        limit = self.limits.get(browser)
+        if not limit:
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        handle = self._lock(browser, limit)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+            os.close(handle)
+
+    def _lock(self, browser, limit):
+        while True:
+            for index in range(limit):
+                handle = os.open(self.directory / f"{browser}-{index}.lock", os.O_RDWR | os.O_CREAT)
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return handle
+                except BlockingIOError:
+                    os.close(handle)
+            time.sleep(self.poll_interval)
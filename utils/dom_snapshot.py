@@ -0,0 +1,112 @@
+import functools
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+from selenium.webdriver.common.by import By
+
+from utils import impact
+
+_PREFIX = "data-snapshot-"
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled(selector):
+    return CSSSelector(selector, translator="html")
+
+
+class SnapshotElement:
+    """Элемент снимка DOM с вычисленными в браузере видимостью и габаритами"""
+
+    def __init__(self, element):
+        self.element = element
+
+    @property
+    def tag(self):
+        return self.element.tag
+
+    @property
+    def visible(self):
+        return self.element.get(_PREFIX + "visible") == "1"
+
+    @property
+    def enabled(self):
+        return self.element.get(_PREFIX + "enabled", "1") == "1"
+
+    @property
+    def value(self):
+        return self.element.get(_PREFIX + "value")
+
+    @property
+    def rect(self):
+        """Габариты элемента: (x, y, ширина, высота)"""
+        return tuple(int(part) for part in self.element.get(_PREFIX + "rect", "0,0,0,0").split(","))
+
+    @property
+    def text(self):
+        """Текст элемента без лишних пробелов (для полей ввода - значение)"""
+        if self.value is not None and self.tag in ("input", "textarea", "select"):
+            return self.value.strip()
+        return " ".join(self.element.text_content().split())
+
+    def get_attribute(self, name):
+        return self.element.get(name)
+
+
+class DomSnapshot:
+    """Снимок DOM страницы для проверок структуры без обращений к браузеру.
+
+    Локаторы из ``locators.py`` ищутся локально: CSS - через cssselect,
+    XPath - через lxml. ``to_css`` переводит остальные стратегии поиска
+    (ID, NAME и т.д.) в CSS-селектор.
+    """
+
+    def __init__(self, data, to_css):
+        self.url = data["url"]
+        self.title = data["title"]
+        self.root = lxml.html.document_fromstring(data["html"])
+        self.to_css = to_css
+
+    def find_all(self, locator):
+        """Найти все элементы по локатору"""
+        by, value = locator
+        if by == By.XPATH:
+            impact.touch_locator(locator)
+            nodes = self.root.xpath(value)
+        else:
+            nodes = _compiled(self.to_css(locator))(self.root)
+        return [SnapshotElement(node) for node in nodes if isinstance(node.tag, str)]
+
+    def find(self, locator):
+        """Первый найденный элемент или None"""
+        elements = self.find_all(locator)
+        return elements[0] if elements else None
+
+    def is_present(self, locator):
+        return self.find(locator) is not None
+
+    def is_visible(self, locator):
+        element = self.find(locator)
+        return element is not None and element.visible
+
+    def probe(self, locators):
+        """Состояние набора элементов: present, count, visible, enabled и text.
+
+        Принимает список локаторов или словарь ``{имя: локатор}`` и
+        возвращает словарь с теми же ключами (для списка - сами локаторы).
+        """
+        if isinstance(locators, dict):
+            items = list(locators.items())
+        else:
+            items = [(locator, locator) for locator in locators]
+        result = {}
+        for key, locator in items:
+            elements = self.find_all(locator)
+            element = elements[0] if elements else None
+            result[key] = {
+                "present": element is not None,
+                "count": len(elements),
+                "visible": element is not None and element.visible,
+                "enabled": element is not None and element.enabled,
+                "text": None if element is None else element.text,
+            }
+        return result
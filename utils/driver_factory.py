@@ -0,0 +1,233 @@
+import abc
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from utils import perf_profiles, readiness
+
+# Файлы блокировки профиля: копия с ними не запустится
+_PROFILE_LOCKS = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile")
+
+
+class PersistentService(Service):
+    """chromedriver, который переживает закрытие отдельных браузеров.
+
+    ``start()`` запускает процесс только один раз, ``stop()`` из
+    ``driver.quit()`` ничего не делает; остановка - через ``shutdown()``.
+    """
+
+    def start(self):
+        # process появляется у Service только после первого start()
+        process = getattr(self, "process", None)
+        if process is None or process.poll() is not None:
+            super().start()
+
+    def stop(self):
+        pass
+
+    def shutdown(self):
+        if getattr(self, "process", None) is not None:
+            super().stop()
+
+
+class ProfileChrome(webdriver.Chrome):
+    """Chrome на клоне профиля: quit() удаляет клон"""
+
+    user_data_dir = None
+
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            if self.user_data_dir:
+                shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class DriverFactory(abc.ABC):
+    """Общая часть фабрик WebDriver одного воркера.
+
+    Подклассы реализуют ``_launch()`` (запуск одного браузера) и
+    ``_shutdown()``. При ``prelaunch`` следующий браузер запускается в фоне,
+    пока идёт текущий тест, и выдаётся следующему вызову сразу.
+    """
+
+    browser = None
+
+    def __init__(self, profile, prelaunch=False):
+        self.profile = profile
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="prelaunch") if prelaunch else None
+        )
+        self._next = None
+
+    def __call__(self):
+        """Выдать готовый браузер (заранее запущенный, если он есть)"""
+        driver = None
+        if self._next is not None:
+            try:
+                driver = self._next.result()
+            except WebDriverException:
+                driver = None
+            self._next = None
+        if driver is None:
+            driver = self._launch()
+        if self._executor is not None:
+            self._next = self._executor.submit(self._launch)
+        return driver
+
+    @abc.abstractmethod
+    def _launch(self):
+        """Запустить и настроить один браузер"""
+
+    def _shutdown(self):
+        pass
+
+    def close(self):
+        """Закрыть заранее запущенный браузер и освободить ресурсы фабрики"""
+        if self._executor is not None:
+            if self._next is not None:
+                try:
+                    self._next.result().quit()
+                except WebDriverException:
+                    pass
+                self._next = None
+            self._executor.shutdown(wait=True)
+        self._shutdown()
+
+
+class ChromeDriverFactory(DriverFactory):
+    """Фабрика Chrome WebDriver для одного воркера.
+
+    - один долгоживущий chromedriver (``PersistentService``) на все браузеры;
+    - шаблон профиля с дисковым кэшем, прогретым заходом на ``warm_url``;
+      каждый браузер стартует на копии шаблона.
+    """
+
+    browser = "chrome"
+
+    def __init__(self, profile, warm_url=None, use_template=True, prelaunch=False,
+                 static_cache_dir=None):
+        super().__init__(profile, prelaunch)
+        self.warm_url = warm_url
+        self.use_template = use_template
+        self.static_cache_dir = static_cache_dir
+        self.service = PersistentService()
+        self._root = tempfile.mkdtemp(prefix="chrome-profiles-")
+        self._template_dir = None
+        self._template_lock = threading.Lock()
+        self._binary_location = None
+        self._sessions = 0
+
+    def _options(self, user_data_dir=None):
+        options = Options()
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--headless")  # Для CI/CD
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--disable-gpu")
+        if user_data_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+        if self._binary_location:
+            options.binary_location = self._binary_location
+        # С шаблоном профиля статика кэшируется в нем, отдельный кэш не нужен
+        perf_profiles.apply_to_options(
+            options, self.profile, None if self.use_template else self.static_cache_dir
+        )
+        return options
+
+    def _start_browser(self, user_data_dir=None):
+        driver = ProfileChrome(options=self._options(user_data_dir), service=self.service)
+        self._binary_location = self._binary_location or driver.options.binary_location
+        return driver
+
+    def _warm_up(self):
+        """Создать шаблон профиля и прогреть его кэш (один раз)"""
+        with self._template_lock:
+            if self._template_dir is not None:
+                return self._template_dir
+            template_dir = os.path.join(self._root, "template")
+            driver = self._start_browser(template_dir)
+            try:
+                if self.warm_url:
+                    driver.get(self.warm_url)
+                    driver.delete_all_cookies()
+                    driver.execute_script(
+                        "try { window.localStorage.clear(); } catch (e) {}"
+                        "try { window.sessionStorage.clear(); } catch (e) {}"
+                    )
+            finally:
+                # quit() у ProfileChrome удаляет каталог, шаблон нужно сохранить
+                webdriver.Chrome.quit(driver)
+            self._template_dir = template_dir
+            return template_dir
+
+    def _launch(self):
+        """Запустить браузер на копии прогретого профиля"""
+        user_data_dir = None
+        if self.use_template:
+            template_dir = self._warm_up()
+            with self._template_lock:
+                self._sessions += 1
+                user_data_dir = os.path.join(self._root, f"session-{self._sessions}")
+            shutil.copytree(
+                template_dir,
+                user_data_dir,
+                symlinks=True,
+                ignore=shutil.ignore_patterns(*_PROFILE_LOCKS),
+            )
+        driver = self._start_browser(user_data_dir)
+        driver.user_data_dir = user_data_dir
+        readiness.install(driver)
+        return perf_profiles.apply_to_driver(driver, self.profile)
+
+    def _shutdown(self):
+        """Остановить chromedriver и удалить временные профили"""
+        self.service.shutdown()
+        shutil.rmtree(self._root, ignore_errors=True)
+
+
+class FirefoxDriverFactory(DriverFactory):
+    """Фабрика Firefox WebDriver для одного воркера.
+
+    geckodriver обслуживает одну сессию, поэтому у каждого браузера свой
+    процесс драйвера; шаблона профиля и блокировки URL через CDP нет.
+    """
+
+    browser = "firefox"
+
+    def __init__(self, profile, prelaunch=False, **kwargs):
+        # Настройки шаблона профиля и кэша статики относятся только к Chrome
+        super().__init__(profile, prelaunch)
+
+    def _options(self):
+        options = FirefoxOptions()
+        options.add_argument("-headless")
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+        return perf_profiles.apply_to_firefox_options(options, self.profile)
+
+    def _launch(self):
+        return webdriver.Firefox(options=self._options())
+
+
+FACTORIES = {
+    ChromeDriverFactory.browser: ChromeDriverFactory,
+    FirefoxDriverFactory.browser: FirefoxDriverFactory,
+}
+
+
+def create_factory(browser, profile, **kwargs):
+    """Создать фабрику для браузера по имени (chrome, firefox)"""
+    if browser not in FACTORIES:
+        raise ValueError(
+            f"Неизвестный браузер: {browser}. Доступны: {', '.join(FACTORIES)}"
+        )
+    return FACTORIES[browser](profile, **kwargs)
@@ -0,0 +1,199 @@
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from utils import impact, timings
+
+
+class PooledDriver:
+    """Драйвер из пула вместе со статистикой использования"""
+
+    def __init__(self, driver, startup_time):
+        self.driver = driver
+        self.startup_time = startup_time
+        self.uses = 0
+
+
+class DriverPool:
+    """Пул «прогретых» WebDriver в пределах одного воркера pytest-xdist.
+
+    Вместо перезапуска браузера между тестами драйвер сбрасывается
+    (cookies, storage, лишние окна, about:blank) и возвращается в пул.
+    Драйвер пересоздаётся после ``max_uses`` тестов или если он перестал
+    отвечать.
+    """
+
+    def __init__(self, factory, max_size=1, max_uses=50):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.max_uses = max(1, max_uses)
+        self._idle = []
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.reused = 0
+        self.recycled = 0
+        self.startup_total = 0.0
+
+    def _start(self):
+        """Запустить новый браузер и замерить время старта"""
+        started_at = time.perf_counter()
+        driver = timings.measure("driver", "startup", self.factory)
+        startup_time = time.perf_counter() - started_at
+        self.started += 1
+        self.startup_total += startup_time
+        return PooledDriver(driver, startup_time)
+
+    def acquire(self):
+        """Взять драйвер из пула (или запустить новый)"""
+        with self._lock:
+            pooled = self._idle.pop() if self._idle else None
+        if pooled is not None and self.is_healthy(pooled.driver):
+            self.reused += 1
+        else:
+            if pooled is not None:
+                self._discard(pooled)
+            pooled = self._start()
+        pooled.uses += 1
+        with self._lock:
+            self._in_use[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver):
+        """Вернуть драйвер в пул после сброса состояния"""
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            return
+        if pooled.uses >= self.max_uses or not self.reset(driver):
+            self._discard(pooled)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(pooled)
+                return
+        self._discard(pooled)
+
+    def reuse(self, driver):
+        """Выдать удерживаемый драйвер следующему тесту.
+
+        Живой драйвер, не исчерпавший ``max_uses``, выдаётся снова (это
+        переиспользование); иначе он закрывается и из пула берётся другой.
+        """
+        with self._lock:
+            pooled = self._in_use.get(id(driver))
+        if pooled is not None and pooled.uses < self.max_uses and self.is_healthy(driver):
+            pooled.uses += 1
+            self.reused += 1
+            return driver
+        if pooled is not None:
+            with self._lock:
+                self._in_use.pop(id(driver), None)
+            self._discard(pooled)
+        return self.acquire()
+
+    def _discard(self, pooled):
+        """Закрыть драйвер, который больше не будет использоваться"""
+        self.recycled += 1
+        try:
+            pooled.driver.quit()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def is_healthy(driver):
+        """Проверить, что браузер отвечает на команды"""
+        try:
+            driver.execute_script("return 1")
+            return bool(driver.window_handles)
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def reset(driver):
+        """Сбросить состояние браузера между тестами"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    @property
+    def saved_time(self):
+        """Оценка сэкономленного времени на запусках браузера (сек)"""
+        if not self.started:
+            return 0.0
+        return self.reused * self.startup_total / self.started
+
+    def stats(self):
+        """Статистика пула для отчёта"""
+        return {
+            "started": self.started,
+            "reused": self.reused,
+            "recycled": self.recycled,
+            "startup_total": round(self.startup_total, 3),
+            "saved_time": round(self.saved_time, 3),
+        }
+
+    def close(self):
+        """Закрыть все драйверы пула"""
+        with self._lock:
+            pooled_drivers = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+        for pooled in pooled_drivers:
+            try:
+                pooled.driver.quit()
+            except WebDriverException:
+                pass
+
+
+class WarmPage:
+    """Страница, открытая в браузере из пула и общая для нескольких тестов.
+
+    Браузер берётся при первом ``get()`` (внутри теста, поэтому его старт
+    попадает в тайминги теста). Каждый ``get()`` проверяет браузер через
+    ``DriverPool.reuse()``: упавший или исчерпавший лимит использований
+    браузер заменяется, и страница открывается на новом заново.
+
+    Методы и локаторы, затронутые при открытии страницы, отмечаются для
+    ``utils.impact`` в каждом тесте, получившем страницу.
+    """
+
+    def __init__(self, pool, open_page):
+        self.pool = pool
+        self.open_page = open_page
+        self.page = None
+        self.touched = set()
+
+    def get(self):
+        """Page Object на живом браузере"""
+        if self.page is None:
+            driver = self.pool.acquire()
+        else:
+            driver = self.pool.reuse(self.page.driver)
+        if self.page is None or driver is not self.page.driver:
+            with impact.capture() as touched:
+                self.page = self.open_page(timings.instrument_driver(driver))
+            self.touched = touched
+        else:
+            for name in self.touched:
+                impact.touch(name)
+        return self.page
+
+    def close(self):
+        """Вернуть браузер в пул"""
+        if self.page is not None:
+            self.pool.release(self.page.driver)
+            self.page = None
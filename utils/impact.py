@@ -0,0 +1,252 @@
+import ast
+import contextlib
+import functools
+import inspect
+import re
+import subprocess
+from pathlib import Path
+
+import locators
+
+# Изменения в этих местах могут повлиять на любой тест
+_GLOBAL_PATHS = ("conftest.py", "config.py", "requirements.txt", "pages/", "utils/", "plugins/",
+                 "local_app/")
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+_touched = None
+_locator_names = None
+
+
+def start():
+    """Начать запись затронутых методов и локаторов для теста"""
+    global _touched
+    _touched = set()
+
+
+def stop():
+    """Закончить запись и вернуть затронутые символы"""
+    global _touched
+    touched, _touched = _touched or set(), None
+    return touched
+
+
+def touch(name):
+    if _touched is not None:
+        _touched.add(name)
+
+
+@contextlib.contextmanager
+def capture():
+    """Записать символы, затронутые внутри блока.
+
+    Записанное остаётся и в записи текущего теста; сам набор можно
+    сохранить, чтобы отметить его в тестах, которые переиспользуют
+    результат блока (например, уже открытую страницу).
+    """
+    global _touched
+    outer = _touched
+    captured = _touched = set()
+    try:
+        yield captured
+    finally:
+        _touched = outer
+        if outer is not None:
+            outer.update(captured)
+
+
+def touch_locator(locator):
+    """Отметить использование локатора как «КлассЛокаторов.АТРИБУТ»"""
+    global _locator_names
+    if _touched is None:
+        return
+    if _locator_names is None:
+        _locator_names = {}
+        for class_name, cls in vars(locators).items():
+            if not class_name.endswith("Locators"):
+                continue
+            for attr, value in vars(cls).items():
+                if isinstance(value, tuple) and len(value) == 2:
+                    _locator_names.setdefault(value, []).append(f"{class_name}.{attr}")
+    _touched.update(_locator_names.get(tuple(locator), ()))
+
+
+def instrument_class(cls):
+    """Отмечать вызовы публичных методов класса Page Object"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, _touching(f"{cls.__name__}.{attr}", value))
+    return cls
+
+
+def _touching(name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        touch(name)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def changed_lines(base, cwd="."):
+    """Измененные строки относительно base (включая рабочую копию): {файл: {строки}}"""
+    output = subprocess.run(
+        ["git", "diff", "-U0", "--no-color", base, "--"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    changes = {path: None for path in untracked}
+    old_path = path = None
+    for line in output.splitlines():
+        if line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[len("--- a/"):]
+        elif line.startswith("+++ "):
+            if line == "+++ /dev/null":
+                path, changes[old_path] = None, None
+            elif old_path is None:
+                path, changes[line[len("+++ b/"):]] = None, None
+            else:
+                path = line[len("+++ b/"):]
+                changes.setdefault(path, set())
+        elif path is not None and (match := _HUNK.match(line)):
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # Удаление без добавления отмечаем строкой, где оно было
+            changes[path].update(range(start, start + max(count, 1)))
+    # None - файл новый или удален: считаем измененным целиком
+    return changes
+
+
+def fixture_names(path):
+    """Имена фикстур, объявленных в файле (функции с декоратором ``pytest.fixture``)"""
+    try:
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return set()
+    names = set()
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if isinstance(target, ast.Attribute) and target.attr == "fixture":
+                names.add(node.name)
+    return names
+
+
+def _symbols_at(path, lines, attributes=False):
+    """Символы (``Класс.атрибут``, ``Класс.*`` или ``функция``) на измененных строках.
+
+    Атрибуты классов отслеживаются по отдельности только при ``attributes``
+    (локаторы); иначе их изменение затрагивает весь класс.
+    """
+    try:
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return None
+    symbols = set()
+    covered = set()
+    for node in tree.body:
+        end = node.end_lineno
+        node_lines = set(range(node.lineno, end + 1))
+        if hasattr(node, "decorator_list"):
+            node_lines.update(range(min([d.lineno for d in node.decorator_list] + [node.lineno]),
+                                    node.lineno))
+        touched = lines & node_lines
+        if not touched:
+            continue
+        covered |= touched
+        if isinstance(node, ast.ClassDef):
+            for member in node.body:
+                member_lines = set(range(member.lineno, member.end_lineno + 1))
+                for decorator in getattr(member, "decorator_list", []):
+                    member_lines.update(range(decorator.lineno, member.lineno))
+                if not touched & member_lines:
+                    continue
+                names = _member_names(member)
+                is_method = isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef))
+                if not names or any(name.startswith("_") for name in names) or not (
+                    is_method or attributes
+                ):
+                    symbols.add(f"{node.name}.*")
+                else:
+                    symbols.update(f"{node.name}.{name}" for name in names)
+                touched = touched - member_lines
+            if touched:
+                symbols.add(f"{node.name}.*")
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.add(node.name)
+        else:
+            return None
+    if lines - covered:
+        # Строки вне определений (импорты, константы модуля) влияют на весь модуль
+        return None
+    return symbols
+
+
+def _member_names(member):
+    if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return [member.name]
+    if isinstance(member, ast.Assign):
+        return [target.id for target in member.targets if isinstance(target, ast.Name)]
+    if isinstance(member, ast.AnnAssign) and isinstance(member.target, ast.Name):
+        return [member.target.id]
+    return []
+
+
+class ChangeSet:
+    """Что затронуто изменениями: символы страниц и локаторов, фикстуры, файлы тестов"""
+
+    def __init__(self, changes, cwd="."):
+        self.run_all = False
+        self.symbols = set()
+        self.fixtures = set()
+        self.test_files = set()
+        root = Path(cwd)
+        for path, lines in changes.items():
+            if path.startswith("tests/") and path.endswith(".py"):
+                self.test_files.add(path)
+            elif path == "conftest.py" and lines is not None:
+                symbols = _symbols_at(root / path, lines)
+                if symbols is None or not symbols <= fixture_names(root / path):
+                    self.run_all = True
+                else:
+                    self.fixtures |= symbols
+            elif path == "locators.py" or (path.startswith("pages/") and path.endswith(".py")):
+                symbols = (
+                    None
+                    if lines is None
+                    else _symbols_at(root / path, lines, attributes=path == "locators.py")
+                )
+                if symbols is None:
+                    self.run_all = True
+                else:
+                    self.symbols |= symbols
+            elif path.startswith(_GLOBAL_PATHS) and path.endswith((".py", ".txt", ".html")):
+                self.run_all = True
+
+    def affects(self, nodeid, fixturenames, touched):
+        """Нужно ли запускать тест (touched=None - связей для него не записано)"""
+        if self.run_all or touched is None:
+            return True
+        if nodeid.split("::", 1)[0] in self.test_files:
+            return True
+        if self.fixtures & set(fixturenames):
+            return True
+        for symbol in self.symbols:
+            if symbol.endswith(".*"):
+                prefix = symbol[:-1]
+                if any(name.startswith(prefix) for name in touched):
+                    return True
+            elif symbol in touched:
+                return True
+        return False
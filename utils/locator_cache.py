@@ -0,0 +1,166 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+import locators
+
+_MATCHED_ALTERNATIVE_SCRIPT = """
+var element = arguments[0];
+return arguments[1].findIndex(function (selector) { return element.matches(selector); });
+"""
+
+_cache = None
+
+
+def split_selector(selector):
+    """Разбить CSS-объединение на альтернативы (запятые внутри [], () и кавычек не считаются)"""
+    alternatives, current, depth, quote = [], [], 0, None
+    for char in selector:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            alternatives.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    alternatives.append("".join(current).strip())
+    return [alternative for alternative in alternatives if alternative]
+
+
+def locator_names():
+    """Имена локаторов из locators.py: {локатор: "Класс.АТРИБУТ"}"""
+    names = {}
+    for class_name, cls in vars(locators).items():
+        if not class_name.endswith("Locators"):
+            continue
+        for attr, value in vars(cls).items():
+            if isinstance(value, tuple) and len(value) == 2:
+                names.setdefault(value, f"{class_name}.{attr}")
+    return names
+
+
+class LocatorCache:
+    """Суженные селекторы для CSS-объединений из locators.py.
+
+    Для каждой страницы (класса Page Object) запоминается, какая альтернатива
+    объединения реально находит элемент. Следующий поиск сначала идёт по ней
+    одной, а при промахе - по полному объединению. Попадания сохраняются в
+    файл между прогонами, статистика поиска - в отчёт по воркеру.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.hits = self._load()
+        self.stats = {}
+        self._names = locator_names()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def narrowed(self, page, selector):
+        """Самая часто срабатывающая альтернатива на странице или None"""
+        counts = self.hits.get(page, {}).get(selector)
+        if not counts:
+            return None
+        return max(counts, key=counts.get)
+
+    def find_elements(self, driver, page, locator):
+        """Найти элементы: сначала по суженному селектору, затем по объединению"""
+        by, selector = locator
+        alternatives = split_selector(selector)
+        started_at = time.perf_counter()
+        narrowed = self.narrowed(page, selector) if len(alternatives) > 1 else None
+        if narrowed is not None:
+            elements = driver.find_elements(By.CSS_SELECTOR, narrowed)
+            if elements:
+                self.record(page, locator, narrowed, "narrowed", started_at)
+                return elements
+
+        elements = driver.find_elements(by, selector)
+        if not elements:
+            self.record(page, locator, None, "misses", started_at)
+        elif len(alternatives) == 1:
+            self.record(page, locator, selector, "full", started_at)
+        else:
+            index = driver.execute_script(_MATCHED_ALTERNATIVE_SCRIPT, elements[0], alternatives)
+            matched = alternatives[index] if index is not None and index >= 0 else None
+            self.record(page, locator, matched, "full", started_at)
+        return elements
+
+    def record(self, page, locator, alternative, outcome, started_at=None, duration=0.0):
+        """Учесть поиск: сработавшую альтернативу, исход и затраченное время.
+
+        ``outcome`` - ``narrowed`` (нашлось по суженному селектору), ``full``
+        (по полному объединению) или ``misses`` (не нашлось).
+        """
+        if started_at is not None:
+            duration = time.perf_counter() - started_at
+        name = self._names.get(tuple(locator), locator[1])
+        with self._lock:
+            if alternative is not None:
+                counts = self.hits.setdefault(page, {}).setdefault(locator[1], {})
+                counts[alternative] = counts.get(alternative, 0) + 1
+            item = self.stats.setdefault(
+                name,
+                {"selector": locator[1], "lookups": 0, "time": 0.0,
+                 "narrowed": 0, "full": 0, "misses": 0},
+            )
+            item["lookups"] += 1
+            item["time"] += duration
+            item[outcome] += 1
+
+    def save(self):
+        """Слить попадания с файлом (его могли обновить другие воркеры) и сохранить"""
+        merged = self._load()
+        with self._lock:
+            for page, selectors in self.hits.items():
+                for selector, counts in selectors.items():
+                    target = merged.setdefault(page, {}).setdefault(selector, {})
+                    for alternative, count in counts.items():
+                        target[alternative] = max(target.get(alternative, 0), count)
+            self.hits = merged
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def dead_alternatives(hits):
+    """Альтернативы объединений, не сработавшие ни на одной странице"""
+    matched = {}
+    for selectors in hits.values():
+        for selector, counts in selectors.items():
+            matched.setdefault(selector, set()).update(
+                alternative for alternative, count in counts.items() if count
+            )
+    return {
+        selector: [alt for alt in split_selector(selector) if alt not in used]
+        for selector, used in matched.items()
+        if any(alt not in used for alt in split_selector(selector))
+    }
+
+
+def enable(path):
+    """Включить кэш суженных селекторов для текущего процесса"""
+    global _cache
+    _cache = LocatorCache(path)
+    return _cache
+
+
+def current():
+    """Активный LocatorCache или None"""
+    return _cache
@@ -0,0 +1,84 @@
+from selenium.common.exceptions import WebDriverException
+
+# Шрифты, аналитика и счетчики не влияют на проверки UI
+_THIRD_PARTY_URLS = [
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*mc.yandex.ru*",
+]
+
+# Профили производительности браузера:
+# page_load_strategy - когда driver.get() возвращает управление (normal/eager/none)
+# blocked_urls - шаблоны URL, блокируемые через CDP Network.setBlockedURLs
+# disable_images - не загружать картинки
+# static_cache - общий дисковый кэш Chrome между сессиями для статики
+PROFILES = {
+    "default": {
+        "page_load_strategy": "normal",
+        "blocked_urls": [],
+        "disable_images": False,
+        "static_cache": False,
+    },
+    "fast": {
+        "page_load_strategy": "eager",
+        "blocked_urls": _THIRD_PARTY_URLS,
+        "disable_images": True,
+        "static_cache": True,
+    },
+    "minimal": {
+        "page_load_strategy": "none",
+        "blocked_urls": _THIRD_PARTY_URLS,
+        "disable_images": True,
+        "static_cache": True,
+    },
+}
+
+
+def get_profile(name, extra_blocked_urls=()):
+    """Получить профиль по имени, добавив дополнительные блокируемые URL"""
+    if name not in PROFILES:
+        raise ValueError(
+            f"Неизвестный профиль производительности: {name}. "
+            f"Доступны: {', '.join(PROFILES)}"
+        )
+    profile = dict(PROFILES[name], name=name)
+    profile["blocked_urls"] = list(profile["blocked_urls"]) + list(extra_blocked_urls)
+    return profile
+
+
+def apply_to_options(options, profile, static_cache_dir):
+    """Настроить опции Chrome до запуска браузера"""
+    options.page_load_strategy = profile["page_load_strategy"]
+    if profile["disable_images"]:
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    # Без каталога (шаблон профиля) кэш остаётся в каталоге профиля
+    if profile["static_cache"] and static_cache_dir:
+        options.add_argument(f"--disk-cache-dir={static_cache_dir}")
+    return options
+
+
+def apply_to_firefox_options(options, profile):
+    """Настроить опции Firefox до запуска браузера (без блокировки URL и кэша)"""
+    options.page_load_strategy = profile["page_load_strategy"]
+    if profile["disable_images"]:
+        options.set_preference("permissions.default.image", 2)
+    return options
+
+
+def apply_to_driver(driver, profile):
+    """Настроить запущенный браузер (блокировка URL через CDP, только Chrome)"""
+    if not profile["blocked_urls"] or not hasattr(driver, "execute_cdp_cmd"):
+        return driver
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile["blocked_urls"]})
+    except WebDriverException:
+        pass
+    return driver
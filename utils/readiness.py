@@ -0,0 +1,198 @@
+import time
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    WebDriverException,
+)
+
+# Трекер готовности страницы: число запросов fetch/XHR в полете, время
+# последней мутации DOM и последнего сетевого события, подписчики на изменения.
+# Повторная установка на той же странице ничего не делает.
+INSTALL_SCRIPT = """
+(function () {
+    if (window.__readiness) {
+        return;
+    }
+    var state = {
+        inflight: 0,
+        lastNetwork: performance.now(),
+        lastMutation: performance.now(),
+        listeners: []
+    };
+    function notify() {
+        state.listeners.slice().forEach(function (listener) { listener(); });
+    }
+    function requestStarted() {
+        state.inflight++;
+        state.lastNetwork = performance.now();
+        notify();
+    }
+    function requestFinished() {
+        state.inflight = Math.max(0, state.inflight - 1);
+        state.lastNetwork = performance.now();
+        notify();
+    }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            requestStarted();
+            return originalFetch.apply(this, arguments).finally(requestFinished);
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        requestStarted();
+        this.addEventListener("loadend", requestFinished);
+        return originalSend.apply(this, arguments);
+    };
+    ["pushState", "replaceState"].forEach(function (name) {
+        var original = history[name];
+        history[name] = function () {
+            var result = original.apply(this, arguments);
+            notify();
+            return result;
+        };
+    });
+    window.addEventListener("popstate", notify);
+    window.addEventListener("hashchange", notify);
+    function observe() {
+        new MutationObserver(function () {
+            state.lastMutation = performance.now();
+            notify();
+        }).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    if (document.documentElement) {
+        observe();
+    } else {
+        document.addEventListener("readystatechange", observe, {once: true});
+    }
+    window.__readiness = state;
+})();
+"""
+
+# Ожидание условий готовности в одном execute_async_script: проверка
+# выполняется на каждое событие трекера и по таймеру окончания «тишины».
+WAIT_SCRIPT = INSTALL_SCRIPT + """
+var condition = arguments[0];
+var done = arguments[arguments.length - 1];
+var state = window.__readiness;
+var started = performance.now();
+var quietTimer = null;
+var deadline = null;
+var finished = false;
+
+function quietLeft(now) {
+    var left = 0;
+    if (condition.network_idle_ms !== null) {
+        if (state.inflight > 0) {
+            return null;
+        }
+        left = Math.max(left, condition.network_idle_ms - (now - state.lastNetwork));
+    }
+    if (condition.dom_stable_ms !== null) {
+        left = Math.max(left, condition.dom_stable_ms - (now - state.lastMutation));
+    }
+    return left;
+}
+
+function matches() {
+    var href = window.location.href;
+    if (condition.url_pattern !== null && !new RegExp(condition.url_pattern).test(href)) {
+        return false;
+    }
+    if (condition.url_not !== null && href === condition.url_not) {
+        return false;
+    }
+    if (condition.absent_selector !== null && document.querySelector(condition.absent_selector)) {
+        return false;
+    }
+    if (condition.present_selector !== null && !document.querySelector(condition.present_selector)) {
+        return false;
+    }
+    return true;
+}
+
+function finish(ok) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    state.listeners.splice(state.listeners.indexOf(evaluate), 1);
+    clearTimeout(quietTimer);
+    clearTimeout(deadline);
+    done({ok: ok, elapsed: performance.now() - started, href: window.location.href});
+}
+
+function evaluate() {
+    if (finished || !matches()) {
+        return;
+    }
+    var left = quietLeft(performance.now());
+    clearTimeout(quietTimer);
+    if (left === 0) {
+        finish(true);
+    } else if (left !== null) {
+        quietTimer = setTimeout(evaluate, left);
+    }
+}
+
+state.listeners.push(evaluate);
+deadline = setTimeout(function () { finish(false); }, condition.timeout_ms);
+evaluate();
+"""
+
+
+def install(driver):
+    """Встроить трекер во все новые документы (Chrome, через CDP)"""
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": INSTALL_SCRIPT}
+            )
+        except WebDriverException:
+            pass
+    return driver
+
+
+def wait_until(driver, timeout, url_pattern=None, url_not=None, absent_selector=None,
+               present_selector=None, network_idle=None, dom_stable=None):
+    """Дождаться условий готовности страницы без опроса со стороны Python.
+
+    ``network_idle`` и ``dom_stable`` - длительность «тишины» в секундах
+    (нет запросов fetch/XHR в полете / нет мутаций DOM). Если во время
+    ожидания страница перезагружается, ожидание продолжается на новой.
+    """
+    condition = {
+        "url_pattern": url_pattern,
+        "url_not": url_not,
+        "absent_selector": absent_selector,
+        "present_selector": present_selector,
+        "network_idle_ms": None if network_idle is None else network_idle * 1000,
+        "dom_stable_ms": None if dom_stable is None else dom_stable * 1000,
+    }
+    deadline = time.monotonic() + timeout
+    if getattr(driver, "_readiness_script_timeout", 0) < timeout + 5:
+        driver.set_script_timeout(timeout + 5)
+        driver._readiness_script_timeout = timeout + 5
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        condition["timeout_ms"] = remaining * 1000
+        try:
+            result = driver.execute_async_script(WAIT_SCRIPT, condition)
+        except JavascriptException as error:
+            # Документ выгрузился во время ожидания (переход) - ждем на новом
+            if "unload" not in str(error).lower():
+                raise
+            continue
+        if result and result["ok"]:
+            return result
+    raise TimeoutException(
+        f"Страница не достигла готовности за {timeout} с: "
+        f"{ {key: value for key, value in condition.items() if value is not None} }"
+    )
@@ -0,0 +1,162 @@
+import time
+
+import psutil
+from selenium.common.exceptions import WebDriverException
+
+# Метрики CDP Performance.getMetrics, которые попадают в снимок
+PAGE_METRICS = (
+    "JSHeapUsedSize",
+    "JSHeapTotalSize",
+    "Nodes",
+    "Documents",
+    "JSEventListeners",
+    "LayoutCount",
+    "RecalcStyleCount",
+)
+
+
+def _service_pid(driver):
+    """PID процесса драйвера (chromedriver, geckodriver)"""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return process.pid if process is not None else None
+
+
+def _browser_pid(driver):
+    """PID корневого процесса браузера (кэшируется на драйвере)"""
+    pid = getattr(driver, "_resources_browser_pid", None)
+    if pid is not None:
+        return pid
+    capabilities = driver.capabilities
+    pid = capabilities.get("moz:processID")
+    user_data_dir = capabilities.get("chrome", {}).get("userDataDir")
+    service_pid = _service_pid(driver)
+    if pid is None and user_data_dir and service_pid:
+        # Браузеры общего chromedriver различаются каталогом профиля
+        for child in psutil.Process(service_pid).children():
+            try:
+                if f"--user-data-dir={user_data_dir}" in child.cmdline():
+                    pid = child.pid
+                    break
+            except psutil.Error:
+                continue
+    driver._resources_browser_pid = pid
+    return pid
+
+
+def process_usage(pid):
+    """RSS (байт) и процессорное время (сек) процесса вместе с дочерними"""
+    if pid is None:
+        return None
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    rss = cpu = 0.0
+    for process in processes:
+        try:
+            rss += process.memory_info().rss
+            times = process.cpu_times()
+            cpu += times.user + times.system
+        except psutil.Error:
+            continue
+    return {"pid": pid, "rss": int(rss), "cpu": round(cpu, 3), "processes": len(processes)}
+
+
+def page_metrics(driver):
+    """Метрики страницы через CDP (только Chrome; для остальных - пустой словарь)"""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return {}
+    try:
+        # Домен Performance включается на вкладку, а тесты могут идти в новых
+        # вкладках; повторное включение на той же вкладке ничего не сбрасывает
+        driver.execute_cdp_cmd("Performance.enable", {})
+        result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    except WebDriverException:
+        return {}
+    return {
+        metric["name"]: metric["value"]
+        for metric in result.get("metrics", [])
+        if metric["name"] in PAGE_METRICS
+    }
+
+
+def sample(driver):
+    """Снимок ресурсов: метрики страницы, браузер и драйвер"""
+    return {
+        "time": time.monotonic(),
+        "metrics": page_metrics(driver),
+        "browser": process_usage(_browser_pid(driver)),
+        "driver": process_usage(_service_pid(driver)),
+    }
+
+
+def compare(before, after, heap_growth, nodes_growth):
+    """Изменение ресурсов за тест и превышенные пороги роста"""
+    record = {"wall": round(after["time"] - before["time"], 3)}
+    for name in ("browser", "driver"):
+        if before[name] is None or after[name] is None:
+            record[name] = None
+            continue
+        record[name] = {
+            "pid": after[name]["pid"],
+            "rss_before": before[name]["rss"],
+            "rss_after": after[name]["rss"],
+            "cpu": round(after[name]["cpu"] - before[name]["cpu"], 3),
+            "processes": after[name]["processes"],
+        }
+    record["metrics"] = {
+        name: {"before": before["metrics"][name], "after": value}
+        for name, value in after["metrics"].items()
+        if name in before["metrics"]
+    }
+
+    flags = []
+    heap = record["metrics"].get("JSHeapUsedSize")
+    if heap and heap["after"] - heap["before"] > heap_growth:
+        flags.append(f"JS heap +{(heap['after'] - heap['before']) / 2**20:.1f} МБ")
+    nodes = record["metrics"].get("Nodes")
+    if nodes and nodes["after"] - nodes["before"] > nodes_growth:
+        flags.append(f"DOM-узлы +{nodes['after'] - nodes['before']:.0f}")
+    record["flags"] = flags
+    return record
+
+
+def worker_profile(records):
+    """Нагрузка одного воркера: пиковая память браузеров и драйверов, загрузка CPU"""
+    peaks = {}
+    cpu = wall = 0.0
+    for record in records:
+        for name in ("browser", "driver"):
+            usage = record[name]
+            if usage is None:
+                continue
+            key = (name, usage["pid"])
+            peaks[key] = max(peaks.get(key, 0), usage["rss_before"], usage["rss_after"])
+            cpu += usage["cpu"]
+        wall += record["wall"]
+    return {
+        "tests": len(records),
+        "peak_rss": sum(peaks.values()),
+        "cpu_seconds": round(cpu, 3),
+        "wall_seconds": round(wall, 3),
+        "cpu_cores": round(cpu / wall, 3) if wall else 0.0,
+    }
+
+
+def machine_capacity(workers, memory_reserve=0.2):
+    """Оценка числа воркеров на текущей машине по памяти и по CPU"""
+    if not workers:
+        return {}
+    memory_total = psutil.virtual_memory().total
+    cpu_count = psutil.cpu_count() or 1
+    peak_rss = max(worker["peak_rss"] for worker in workers.values())
+    cpu_cores = max(worker["cpu_cores"] for worker in workers.values())
+    return {
+        "memory_total": memory_total,
+        "cpu_count": cpu_count,
+        "peak_rss_per_worker": peak_rss,
+        "cpu_cores_per_worker": cpu_cores,
+        "workers_by_memory": int(memory_total * (1 - memory_reserve) // peak_rss) if peak_rss else None,
+        "workers_by_cpu": int(cpu_count // cpu_cores) if cpu_cores else None,
+    }
@@ -0,0 +1,142 @@
+import functools
+import inspect
+import threading
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+_local = threading.local()
+
+
+class TimingRecorder:
+    """Замеры времени одного теста: команды WebDriver, ожидания, методы Page Object"""
+
+    def __init__(self):
+        self.entries = []
+        self.page_loads = []
+        self.meta = {}
+        self._stack = []
+
+    def record(self, kind, name, duration, started_at):
+        self.entries.append(
+            {
+                "kind": kind,
+                "name": name,
+                "duration": round(duration, 6),
+                "offset": round(started_at - self.started_at, 6),
+                "parent": self._stack[-1][1] if self._stack else None,
+            }
+        )
+
+    def measure(self, kind, name, func, *args, **kwargs):
+        """Выполнить func, записав время выполнения"""
+        started_at = time.perf_counter()
+        self._stack.append((kind, name))
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._stack.pop()
+            self.record(kind, name, time.perf_counter() - started_at, started_at)
+
+    @property
+    def current_method(self):
+        """Самый вложенный выполняющийся метод Page Object"""
+        for kind, name in reversed(self._stack):
+            if kind == "method":
+                return name
+        return None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        _local.recorder = self
+        return self
+
+    def stop(self):
+        self.total = time.perf_counter() - self.started_at
+        _local.recorder = None
+        return self
+
+    def summary(self):
+        """Сводка по (вид, имя): количество, суммарное и максимальное время"""
+        result = {}
+        for entry in self.entries:
+            key = f"{entry['kind']}:{entry['name']}"
+            item = result.setdefault(key, {"count": 0, "total": 0.0, "max": 0.0})
+            item["count"] += 1
+            item["total"] = round(item["total"] + entry["duration"], 6)
+            item["max"] = max(item["max"], entry["duration"])
+        return result
+
+    def to_dict(self):
+        return {
+            **self.meta,
+            "total": round(getattr(self, "total", 0.0), 6),
+            "page_loads": self.page_loads,
+            "summary": self.summary(),
+            "entries": self.entries,
+        }
+
+
+def current():
+    """Активный TimingRecorder текущего теста или None"""
+    return getattr(_local, "recorder", None)
+
+
+def measure(kind, name, func, *args, **kwargs):
+    """Выполнить func, записав время в активный TimingRecorder (если он есть)"""
+    recorder = current()
+    if recorder is None:
+        return func(*args, **kwargs)
+    return recorder.measure(kind, name, func, *args, **kwargs)
+
+
+def instrument_driver(driver):
+    """Засекать время каждой команды WebDriver (повторный вызов безопасен)"""
+    if getattr(driver, "_timed_execute", False):
+        return driver
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def timed_execute(driver_command, params=None):
+        recorder = current()
+        if recorder is None:
+            return execute(driver_command, params)
+        return recorder.measure("command", driver_command, execute, driver_command, params)
+
+    driver.execute = timed_execute
+    driver._timed_execute = True
+    return driver
+
+
+def _timed_method(name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return measure("method", name, func, *args, **kwargs)
+
+    return wrapper
+
+
+def instrument_class(cls):
+    """Засекать время публичных методов класса Page Object"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, _timed_method(f"{cls.__name__}.{attr}", value))
+    return cls
+
+
+class TimedWebDriverWait(WebDriverWait):
+    """WebDriverWait, записывающий время ожидания вместе с опросами"""
+
+    def _measure(self, wait, method, message):
+        recorder = current()
+        if recorder is None:
+            return wait(method, message)
+        name = recorder.current_method or getattr(method, "__name__", "wait")
+        return recorder.measure("wait", name, wait, method, message)
+
+    def until(self, method, message=""):
+        return self._measure(super().until, method, message)
+
+    def until_not(self, method, message=""):
+        return self._measure(super().until_not, method, message)